@@ -305,6 +305,10 @@ def dict_from_bytes(
         # length of string (if defined in PLC))
 
     """
+    # Copy the data into a single bytes object once, the fields are then
+    # decoded in place
+    data = bytes(byte_list)
+
     values_list: List[Dict[str, Any]] = []
     index = 0
     for structure in range(0, array_size):
@@ -323,7 +327,7 @@ def dict_from_bytes(
                     if str_len is None:
                         str_len = PLC_DEFAULT_STRING_SIZE
                     var_array.append(
-                        bytearray(byte_list[index: (index + (str_len + 1))])
+                        data[index: (index + (str_len + 1))]
                         .partition(b"\0")[0]
                         .decode("utf-8")
                     )
@@ -332,7 +336,7 @@ def dict_from_bytes(
                     if str_len is None:  # if no str_len is given use default size
                         str_len = PLC_DEFAULT_STRING_SIZE
                     n_bytes = 2 * (str_len + 1)  # WSTRING uses 2 bytes per character + null-terminator
-                    a = bytearray(byte_list[index: (index + n_bytes)])
+                    a = data[index: (index + n_bytes)]
                     null_idx = find_wstring_null_terminator(a)
                     var_array.append(a[:null_idx].decode("utf-16-le"))
                     index += n_bytes
@@ -340,7 +344,7 @@ def dict_from_bytes(
                     n_bytes = size_of_structure(plc_datatype)
                     var_array.append(
                         dict_from_bytes(
-                            byte_list[index : (index + n_bytes)],
+                            data[index : (index + n_bytes)],
                             structure_def=plc_datatype,
                         )
                     )
@@ -350,10 +354,7 @@ def dict_from_bytes(
                 else:
                     n_bytes = sizeof(plc_datatype)
                     var_array.append(
-                        struct.unpack(
-                            DATATYPE_MAP[plc_datatype],
-                            bytearray(byte_list[index: (index + n_bytes)]),
-                        )[0]
+                        struct.unpack_from(DATATYPE_MAP[plc_datatype], data, index)[0]
                     )
                     index += n_bytes
             if size == 1:  # if not an array, don't want a list in the dict return
@@ -399,7 +400,7 @@ def bytes_from_dict(
         # length of string (if defined in PLC))
 
     """
-    byte_list = []
+    byte_list: List[int] = []
     if not isinstance(values, list):
         values = [values]
 
@@ -417,24 +418,24 @@ def bytes_from_dict(
                     if str_len is None:
                         str_len = PLC_DEFAULT_STRING_SIZE
                     if size > 1:
-                        byte_list += list(var[i].encode("utf-8"))
+                        byte_list += var[i].encode("utf-8")
                         remaining_bytes = str_len + 1 - len(var[i])  # 1 byte a character plus null-terminator
                     else:
-                        byte_list += list(var.encode("utf-8"))
+                        byte_list += var.encode("utf-8")
                         remaining_bytes = str_len + 1 - len(var)  # 1 byte a character plus null-terminator
-                    byte_list.extend(remaining_bytes * [0])
+                    byte_list += bytes(max(remaining_bytes, 0))
                 elif plc_datatype == PLCTYPE_WSTRING:
                     if str_len is None:
                         str_len = PLC_DEFAULT_STRING_SIZE
                     if size > 1:
-                        encoded = list(var[i].encode("utf-16-le"))
+                        encoded = var[i].encode("utf-16-le")
                         byte_list += encoded
                         remaining_bytes = 2 * (str_len + 1) - len(encoded)  # 2 bytes a character plus null-terminator
                     else:
-                        encoded = list(var.encode("utf-16-le"))
+                        encoded = var.encode("utf-16-le")
                         byte_list += encoded
                         remaining_bytes = 2 * (str_len + 1) - len(encoded)  # 2 bytes a character plus null-terminator
-                    byte_list.extend(remaining_bytes * [0])
+                    byte_list += bytes(max(remaining_bytes, 0))
                 elif type(plc_datatype) is tuple:
                     bytecount = bytes_from_dict(
                         values=var[i], structure_def=plc_datatype
@@ -444,11 +445,9 @@ def bytes_from_dict(
                     raise RuntimeError("Datatype not found. Check structure definition")
                 else:
                     if size > 1:
-                        byte_list += list(
-                            struct.pack(DATATYPE_MAP[plc_datatype], var[i])
-                        )
+                        byte_list += struct.pack(DATATYPE_MAP[plc_datatype], var[i])
                     else:
-                        byte_list += list(struct.pack(DATATYPE_MAP[plc_datatype], var))
+                        byte_list += struct.pack(DATATYPE_MAP[plc_datatype], var)
     return byte_list
 
 
@@ -97,6 +97,72 @@ from .symbol import AdsSymbol
 from .utils import decode_ads
 
 
+def _decode_notification_string(data: Array) -> str:
+    """Decode notification data as null-terminated STRING."""
+    # read only until null-termination character
+    return bytearray(data).split(b"\0", 1)[0].decode("utf-8")
+
+
+def _decode_notification_bytes(data: Array) -> bytearray:
+    """Return notification data of an unknown datatype as raw bytes."""
+    return bytearray(data)
+
+
+def _decode_notification_structure(
+    plc_datatype: Type[Structure], data: Array
+) -> Structure:
+    """Decode notification data into a ctypes structure."""
+    value = plc_datatype()
+    fit_size = min(sizeof(data), sizeof(value))
+    memmove(addressof(value), addressof(data), fit_size)
+    return value
+
+
+def _decode_notification_array(
+    plc_datatype: Type[Array], data: Array
+) -> Optional[List[Any]]:
+    """Decode notification data into a list, None on size mismatch."""
+    if sizeof(data) == sizeof(plc_datatype):
+        return list(plc_datatype.from_buffer_copy(data))
+    # invalid size
+    return None
+
+
+def _decode_notification_primitive(
+    unpack: Callable[[Array], Tuple[Any, ...]], data: Array
+) -> Any:
+    """Decode notification data of a basic PLC datatype."""
+    # unpack straight from the ctypes buffer, no intermediate copy needed
+    return unpack(data)[0]
+
+
+# Decoders for the basic PLC datatypes, keyed by datatype
+_NOTIFICATION_DECODERS: Dict[Type, Callable[[Array], Any]] = {
+    plc_datatype: partial(
+        _decode_notification_primitive, struct.Struct(fmt).unpack
+    )
+    for plc_datatype, fmt in DATATYPE_MAP.items()
+}
+_NOTIFICATION_DECODERS[PLCTYPE_STRING] = _decode_notification_string
+
+
+def _get_notification_decoder(
+    plc_datatype: Optional[Type]
+) -> Callable[[Array], Any]:
+    """Return the function converting notification data into `plc_datatype`."""
+    decoder = _NOTIFICATION_DECODERS.get(plc_datatype)  # type: ignore
+    if decoder is not None:
+        return decoder
+
+    if plc_datatype is not None and issubclass(plc_datatype, Structure):
+        return partial(_decode_notification_structure, plc_datatype)
+
+    if plc_datatype is not None and issubclass(plc_datatype, Array):
+        return partial(_decode_notification_array, plc_datatype)
+
+    return _decode_notification_bytes
+
+
 class Connection(object):
     """Class for managing the connection to an ADS device.
 
@@ -168,12 +234,12 @@ class Connection(object):
         # If the connection is already closed, nothing new will happen
         self.close()
 
-    def _query_plc_datatype_from_name(self, data_name: str,
-                                      cache_symbol_info: bool) -> Type:
-        """Return the plc_datatype by reading SymbolInfo from the target.
+    def _query_symbol_info(self, data_name: str,
+                           cache_symbol_info: bool) -> SAdsSymbolEntry:
+        """Return the SymbolInfo of a variable from the target.
 
-        If cache_symbol_info is True then the SymbolInfo will be cached and adsGetSymbolInfo
-        will only used once.
+        If cache_symbol_info is True then the SymbolInfo will be cached and
+        adsGetSymbolInfo will only used once.
 
         """
         if cache_symbol_info:
@@ -183,6 +249,17 @@ class Connection(object):
                 self._symbol_info_cache[data_name] = info
         else:
             info = adsGetSymbolInfo(self._port, self._adr, data_name)
+        return info
+
+    def _query_plc_datatype_from_name(self, data_name: str,
+                                      cache_symbol_info: bool) -> Type:
+        """Return the plc_datatype by reading SymbolInfo from the target.
+
+        If cache_symbol_info is True then the SymbolInfo will be cached and adsGetSymbolInfo
+        will only used once.
+
+        """
+        info = self._query_symbol_info(data_name, cache_symbol_info)
         return AdsSymbol.get_type_from_str(info.symbol_type)
 
     def open(self) -> None:
@@ -217,6 +294,9 @@ class Connection(object):
             adsPortCloseEx(self._port)
             self._port = None
 
+        # The symbols may have changed until the connection is opened again
+        self._symbol_info_cache.clear()
+
         self._open = False
 
     def get_local_address(self) -> Optional[AmsAddr]:
@@ -389,6 +469,7 @@ class Connection(object):
             auto_update: bool = False,
             structure_def: Optional["StructureDef"] = None,
             array_size: Optional[int] = 1,
+            cache_symbol_info: bool = True,
     ) -> AdsSymbol:
         """Create a symbol instance
 
@@ -412,6 +493,8 @@ class Connection(object):
             the structure defined in the PLC, PLC structure must be defined with
             {attribute 'pack_mode' :=  '1'}
         :param Optional[int] array_size: size of array if reading array of structure, defaults to 1
+        :param bool cache_symbol_info: when True, the symbol info looked up by
+            name will be cached for future lookups of the same symbol
 
         Expected input example for structure_def:
 
@@ -430,6 +513,16 @@ class Connection(object):
             # length of string (if defined in PLC))
 
         """
+        missing_info = (
+            index_group is None or index_offset is None or plc_datatype is None
+        )
+        if name is not None and missing_info:
+            # Look up the symbol here so the info can be taken from the cache
+            info = self._query_symbol_info(name, cache_symbol_info)
+            index_group = info.iGroup
+            index_offset = info.iOffs
+            plc_datatype = info.symbol_type
+            comment = info.comment or comment
 
         return AdsSymbol(self, name, index_group, index_offset, plc_datatype,
                          comment, auto_update=auto_update, structure_def=structure_def,
@@ -953,9 +1046,12 @@ class Connection(object):
         def notification_decorator(
                 func: Callable[[int, str, Union[datetime, int], Any], None]
         ) -> Callable[[Any, str], None]:
+            # resolve the value conversion once, not on every notification
+            decoder = _get_notification_decoder(plc_datatype)
+
             def func_wrapper(notification: Any, data_name: str) -> None:
-                h_notification, timestamp, value = self.parse_notification(
-                    notification, plc_datatype, timestamp_as_filetime
+                h_notification, timestamp, value = self._parse_notification(
+                    notification, decoder, timestamp_as_filetime
                 )
                 return func(h_notification, data_name, timestamp, value)
 
@@ -1012,34 +1108,27 @@ class Connection(object):
                         >>>     # Remove notification
                         >>>     plc.del_device_notification(handles)
                         """
+        return self._parse_notification(
+            notification,
+            _get_notification_decoder(plc_datatype),
+            timestamp_as_filetime,
+        )
+
+    # noinspection PyMethodMayBeStatic
+    def _parse_notification(
+            self,
+            notification: Any,
+            decoder: Callable[[Array], Any],
+            timestamp_as_filetime: bool = False,
+    ) -> Tuple[int, Union[datetime, int], Any]:
+        """Parse a notification with an already resolved value decoder."""
         contents = notification.contents
         data_size = contents.cbSampleSize
         # Get dynamically sized data array
         data = (c_ubyte * data_size).from_address(
             addressof(contents) + SAdsNotificationHeader.data.offset
         )
-        value: Any
-        if plc_datatype == PLCTYPE_STRING:
-            # read only until null-termination character
-            value = bytearray(data).split(b"\0", 1)[0].decode("utf-8")
-
-        elif plc_datatype is not None and issubclass(plc_datatype, Structure):
-            value = plc_datatype()
-            fit_size = min(data_size, sizeof(value))
-            memmove(addressof(value), addressof(data), fit_size)
-
-        elif plc_datatype is not None and issubclass(plc_datatype, Array):
-            if data_size == sizeof(plc_datatype):
-                value = list(plc_datatype.from_buffer_copy(bytes(data)))
-            else:
-                # invalid size
-                value = None
-
-        elif plc_datatype not in DATATYPE_MAP:
-            value = bytearray(data)
-
-        else:
-            value = struct.unpack(DATATYPE_MAP[plc_datatype], bytearray(data))[0]
+        value = decoder(data)
 
         if timestamp_as_filetime:
             timestamp = contents.nTimeStamp
@@ -31,13 +31,13 @@
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 from typing import Optional
 from datetime import datetime, timedelta, tzinfo
-from calendar import timegm
 
 
 # http://support.microsoft.com/kb/167296
 # How To Convert a UNIX time_t to a Win32 FILETIME or SYSTEMTIME
 EPOCH_AS_FILETIME = 116444736000000000  # January 1, 1970 as MS file time
 HUNDREDS_OF_NANOSECONDS = 10000000
+EPOCH_AS_DATETIME = datetime(1970, 1, 1)  # January 1, 1970 as naive datetime
 
 
 ZERO = timedelta(0)
@@ -80,9 +80,11 @@ def dt_to_filetime(dt):
     116444736000000000L
 
     """
-    if (dt.tzinfo is None) or (dt.tzinfo.utcoffset(dt) is None):
-        dt = dt.replace(tzinfo=utc)
-    return EPOCH_AS_FILETIME + (timegm(dt.timetuple()) * HUNDREDS_OF_NANOSECONDS)
+    # Take the whole seconds since the epoch from the wall time, like
+    # calendar.timegm(dt.timetuple()) but without the Python level calendar math
+    delta = dt.replace(tzinfo=None) - EPOCH_AS_DATETIME
+    seconds = delta.days * 86400 + delta.seconds
+    return EPOCH_AS_FILETIME + (seconds * HUNDREDS_OF_NANOSECONDS)
 
 
 def filetime_to_dt(ft):
@@ -119,6 +119,12 @@ else:  # pragma: no cover, can not test unsupported platform
 
 callback_store: Dict[Tuple[AmsAddr, int], Callable[[SAmsAddr, SAdsNotificationHeader, int], None]] = dict()
 
+# memoryview formats of ctypes arrays of numbers in native byte order, these
+# can be converted to a list without creating a ctypes object per element
+_NATIVE_ARRAY_FORMATS = frozenset(
+    ("<" if sys.byteorder == "little" else ">") + code for code in "?bBhHiIlLqQfd"
+)
+
 
 class ADSError(Exception):
     """Error class for errors related to ADS communication."""
@@ -273,6 +279,9 @@ def get_value_from_ctype_data(read_data: Optional[Any], plc_type: Type) -> Any:
         return bytearray(read_data[:null_idx]).decode("utf-16-le")
 
     if type(plc_type).__name__ == "PyCArrayType":
+        view = memoryview(read_data)
+        if view.ndim == 1 and view.format in _NATIVE_ARRAY_FORMATS:
+            return view.cast("B").cast(view.format[1:]).tolist()  # type: ignore
         return list(read_data)
 
     if hasattr(read_data, "value"):
@@ -635,11 +644,12 @@ def adsSyncWriteReqEx(
         if type(plc_data_type).__name__ == "PyCArrayType":
             data = plc_data_type(*value)
         elif type(value) is plc_data_type:
+            # ctypes values of the matching type are sent without conversion
             data = value
         else:
             data = plc_data_type(value)
 
-        data_pointer = ctypes.pointer(data)
+        data_pointer = ctypes.byref(data)
         data_length = ctypes.sizeof(data)
 
     error_code = sync_write_request(
@@ -1008,11 +1018,11 @@ def adsSumRead(
                 value = bytearray(sum_response[offset: offset + null_idx]).decode("utf-8")
             elif data_symbols[data_name].dataType == ADST_WSTRING:
                 # find null-terminator 2 Bytes
-                a = sum_response[offset: offset + data_symbols[data_name].size]
+                a = bytes(sum_response[offset: offset + data_symbols[data_name].size])
                 null_idx = find_wstring_null_terminator(a)
                 if null_idx is None:
                     raise ValueError("No null-terminator found in buffer")
-                value = bytearray(sum_response[offset: offset + null_idx]).decode("utf-16-le")
+                value = a[:null_idx].decode("utf-16-le")
             else:
                 value = struct.unpack_from(
                     DATATYPE_MAP[ads_type_to_ctype[data_symbols[data_name].dataType]],
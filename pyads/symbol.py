@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import re
 from ctypes import sizeof
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Optional, List, Tuple, Callable, Union, Type
 
 from . import constants  # To access all constants, use package notation
@@ -287,6 +288,7 @@ class AdsSymbol:
         self._value = value
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def get_type_from_str(type_str: str) -> Optional[Type[PLCDataType]]:
         """Get PLCTYPE_* from PLC name string
 
@@ -294,6 +296,9 @@ class AdsSymbol:
         purpose to prevent a program from crashing when an unusable symbol
         is found. Instead, exceptions will be thrown when this unmapped
         symbol is read/written.
+
+        Results are cached, as the same type names are resolved over and
+        over again when symbols are created.
         """
 
         # If simple scalar
@@ -15,6 +15,18 @@ from pyads import constants, structs
 from pyads.filetimes import dt_to_filetime
 from pyads.pyads_ex import callback_store
 
+# Precompiled formats of the AMS header and ADS command fields
+_U16LE = struct.Struct("<H")
+_U32LE = struct.Struct("<I")
+_2U32LE = struct.Struct("<II")
+_3U32LE = struct.Struct("<III")
+_4U32LE = struct.Struct("<IIII")
+_6U32LE = struct.Struct("<IIIIII")
+# SAdsSymbolEntry up to the name, type and comment lengths
+_SYMBOL_ENTRY = struct.Struct("<IIIIIIHHH")
+# Handle, time stamp and sample size of an AdsNotificationHeader
+_NOTIFICATION_HEADER = struct.Struct("<IQI")
+
 
 class PLCVariable:
     """Storage item for named data.
@@ -106,8 +118,7 @@ class PLCVariable:
         )
 
         read_data = (
-            struct.pack(
-                "<IIIIIIHHH",
+            _SYMBOL_ENTRY.pack(
                 entry_length,  # Number of packed bytes
                 self.index_group,
                 self.index_offset,
@@ -133,14 +144,18 @@ class PLCVariable:
         if self.value != value:
             if self.notifications:
 
-                header = structs.SAdsNotificationHeader()
-                header.hNotification = 0
-                header.nTimeStamp = dt_to_filetime(datetime.now())
-                header.cbSampleSize = len(value)
-
-                # Perform byte-write into the header
-                dst = ctypes.addressof(header) + structs.SAdsNotificationHeader.data.offset
-                ctypes.memmove(dst, value, len(value))
+                # Write header and sample into one buffer that is large enough
+                # for the whole sample, the header structure is a view on it
+                data_offset = structs.SAdsNotificationHeader.data.offset
+                buffer = bytearray(
+                    max(data_offset + len(value),
+                        ctypes.sizeof(structs.SAdsNotificationHeader))
+                )
+                _NOTIFICATION_HEADER.pack_into(
+                    buffer, 0, 0, dt_to_filetime(datetime.now()), len(value)
+                )
+                buffer[data_offset:data_offset + len(value)] = value
+                header = structs.SAdsNotificationHeader.from_buffer(buffer)
 
                 for notification_handle in self.notifications:
 
@@ -217,21 +232,21 @@ class AdvancedHandler(AbstractHandler):
         """Handle incoming requests and create a response."""
         # Extract command id from the request
         command_id_bytes = request.ams_header.command_id
-        command_id = struct.unpack("<H", command_id_bytes)[0]
+        command_id = _U16LE.unpack(command_id_bytes)[0]
 
         # Set AMS state correctly for response
-        state = struct.unpack("<H", request.ams_header.state_flags)[0]
+        state = _U16LE.unpack(request.ams_header.state_flags)[0]
         state = state | 0x0001  # Set response flag
-        state = struct.pack("<H", state)
+        state = _U16LE.pack(state)
 
         def handle_read_device_info() -> bytes:
             """Create dummy response: version 1.2.3, device name 'TestServer'."""
             logger.info("Command received: READ_DEVICE_INFO")
 
-            major_version = "\x01".encode("utf-8")
-            minor_version = "\x02".encode("utf-8")
-            version_build = "\x03\x00".encode("utf-8")
-            device_name = "TestServer\x00".encode("utf-8")
+            major_version = b"\x01"
+            minor_version = b"\x02"
+            version_build = b"\x03\x00"
+            device_name = b"TestServer\x00"
 
             response_content = (
                 major_version + minor_version + version_build + device_name
@@ -243,9 +258,7 @@ class AdvancedHandler(AbstractHandler):
             """Handle read request."""
             data = request.ams_header.data
 
-            index_group = struct.unpack("<I", data[:4])[0]
-            index_offset = struct.unpack("<I", data[4:8])[0]
-            plc_datatype = struct.unpack("<I", data[8:12])[0]
+            index_group, index_offset, plc_datatype = _3U32LE.unpack_from(data)
 
             logger.info(
                 (
@@ -261,13 +274,14 @@ class AdvancedHandler(AbstractHandler):
             elif index_group == constants.ADSIGRP_SYM_UPLOADINFO2:
                 symbol_count = len(self._data)
                 response_length = 120 * symbol_count
-                response_value = struct.pack("II", symbol_count, response_length)
+                response_value = _2U32LE.pack(symbol_count, response_length)
 
             elif index_group == constants.ADSIGRP_SYM_UPLOAD:
-                response_value = b""
-                for (group, offset) in self._data.keys():
-                    response_value += struct.pack("III", 120, group, offset)
-                    response_value += b"\x00" * 108
+                # Entries of 120 bytes, only entry length, index group and
+                # index offset are filled
+                response_value = bytearray(120 * len(self._data))
+                for i, (group, offset) in enumerate(self._data.keys()):
+                    _3U32LE.pack_into(response_value, 120 * i, 120, group, offset)
 
             else:
                 # Create response of repeated 0x0F with a null
@@ -275,15 +289,13 @@ class AdvancedHandler(AbstractHandler):
                 var = self.get_variable_by_indices(index_group, index_offset)
                 response_value = var.value[:plc_datatype]
 
-            return struct.pack("<I", len(response_value)) + response_value
+            return _U32LE.pack(len(response_value)) + response_value
 
         def handle_write() -> bytes:
             """Handle write request."""
             data = request.ams_header.data
 
-            index_group = struct.unpack("<I", data[:4])[0]
-            index_offset = struct.unpack("<I", data[4:8])[0]
-            plc_datatype = struct.unpack("<I", data[8:12])[0]
+            index_group, index_offset, plc_datatype = _3U32LE.unpack_from(data)
             value = data[12 : (12 + plc_datatype)]
 
             logger.info(
@@ -313,10 +325,8 @@ class AdvancedHandler(AbstractHandler):
             data = request.ams_header.data
 
             # parse the request
-            index_group = struct.unpack("<I", data[:4])[0]
-            index_offset = struct.unpack("<I", data[4:8])[0]
-            read_length = struct.unpack("<I", data[8:12])[0]
-            write_length = struct.unpack("<I", data[12:16])[0]
+            index_group, index_offset, read_length, write_length = \
+                _4U32LE.unpack_from(data)
             write_data = data[16 : (16 + write_length)]
 
             logger.info(
@@ -342,7 +352,7 @@ class AdvancedHandler(AbstractHandler):
                 # variable if it does not yet exist
                 var = self.get_variable_by_name(var_name)
 
-                read_data = struct.pack("<I", var.handle)
+                read_data = _U32LE.pack(var.handle)
 
             # Get the symbol if requested
             elif index_group == constants.ADSIGRP_SYM_INFOBYNAMEEX:
@@ -355,16 +365,8 @@ class AdvancedHandler(AbstractHandler):
             # Write to a list of variables
             elif index_group == constants.ADSIGRP_SUMUP_WRITE:
                 num_requests = index_offset  # number of requests is coded in the offset for sumup_write
-                rq_list = [
-                    (
-                        struct.unpack("<I", write_data[i : i + 4])[0],  # index_group
-                        struct.unpack("<I", write_data[i + 4 : i + 8])[
-                            0
-                        ],  # index_offset
-                        struct.unpack("<I", write_data[i + 8 : i + 12])[0],  # size
-                    )
-                    for i in range(0, num_requests * 12, 12)
-                ]
+                # index_group, index_offset and size of each request
+                rq_list = _3U32LE.iter_unpack(write_data[: num_requests * 12])
 
                 data = write_data[num_requests * 12 :]
                 offset = 0
@@ -374,23 +376,15 @@ class AdvancedHandler(AbstractHandler):
                     var.write(data[offset : offset + size], request)
                     offset += size
 
-                read_data = struct.pack("<" + num_requests * "I", *(num_requests * [0]))
+                read_data = bytes(4 * num_requests)  # error code 0 per request
 
             # Read a list of variables
             elif index_group == constants.ADSIGRP_SUMUP_READ:
                 num_requests = index_offset
-                rq_list = [
-                    (
-                        struct.unpack("<I", write_data[i : i + 4])[0],  # index_group
-                        struct.unpack("<I", write_data[i + 4 : i + 8])[
-                            0
-                        ],  # index_offset
-                        struct.unpack("<I", write_data[i + 8 : i + 12])[0],  # size
-                    )
-                    for i in range(0, num_requests * 12, 12)
-                ]
-
-                read_data = struct.pack("<" + num_requests * "I", *(num_requests * [0]))
+                # index_group, index_offset and size of each request
+                rq_list = _3U32LE.iter_unpack(write_data[: num_requests * 12])
+
+                read_data = bytes(4 * num_requests)  # error code 0 per request
                 for index_group, index_offset, size in rq_list:
                     var = self.get_variable_by_indices(index_group, index_offset)
                     read_data += var.value
@@ -405,15 +399,15 @@ class AdvancedHandler(AbstractHandler):
                 # store write data
                 var.write(write_data, request)
 
-            return struct.pack("<I", len(read_data)) + read_data
+            return _U32LE.pack(len(read_data)) + read_data
 
         def handle_read_state() -> bytes:
             """Handle read-state request."""
             logger.info("Command received: READ_STATE")
-            ads_state = struct.pack("<H", constants.ADSSTATE_RUN)
+            ads_state = _U16LE.pack(constants.ADSSTATE_RUN)
             # I don't know what an appropriate value for device state is.
             # I suspect it may be unused..
-            device_state = struct.pack("<H", 0)
+            device_state = _U16LE.pack(0)
             return ads_state + device_state
 
         def handle_writectrl() -> bytes:
@@ -433,7 +427,7 @@ class AdvancedHandler(AbstractHandler):
             data = request.ams_header.data
 
             index_group, index_offset, length, mode, max_delay, cycle_time = \
-                struct.unpack("<IIIIII", data[:24])
+                _6U32LE.unpack_from(data)
 
             logger.info(
                 "Command received: ADD_DEVICE_NOTIFICATION (index_group={}, "
@@ -454,7 +448,7 @@ class AdvancedHandler(AbstractHandler):
 
             data = request.ams_header.data
 
-            handle = struct.unpack("<I", data[:4])[0]
+            handle = _U32LE.unpack_from(data)[0]
 
             logger.info("Command received: DELETE_DEVICE_NOTIFICATION (handle={})".format(handle))
 
@@ -490,11 +484,11 @@ class AdvancedHandler(AbstractHandler):
         else:
             logger.info("Unknown Command: {0}".format(hex(command_id)))
             # Set error code to 'unknown command ID'
-            error_code = "\x08\x00\x00\x00".encode("utf-8")
-            return AmsResponseData(state, error_code, "".encode("utf-8"))
+            error_code = b"\x08\x00\x00\x00"
+            return AmsResponseData(state, error_code, b"")
 
         # Set no error in response
-        error_code = ("\x00" * 4).encode("utf-8")
+        error_code = b"\x00" * 4
         response_data = error_code + content
 
         return AmsResponseData(state, request.ams_header.error_code, response_data)
@@ -31,6 +31,13 @@ from .advanced_handler import AdvancedHandler
 
 ADS_PORT = 0xBF02
 
+# AMS/TCP header (without the reserved bytes) and AMS header of a request,
+# every field is kept as raw bytes
+_AMS_PACKET_HEADER = struct.Struct("<2x4s6s2s6s2s2s2s4s4s4s")
+
+# AMS/TCP header and AMS header of a response, only the lengths are packed
+_AMS_RESPONSE_HEADER = struct.Struct("<2xI6s2s6s2s2s2sI4s4s")
+
 
 class AdsTestServer(threading.Thread):
     """Simple ADS testing server.
@@ -55,6 +62,9 @@ class AdsTestServer(threading.Thread):
         self.port = port
         self._run = True
 
+        # Set by the server thread as soon as it accepts connections
+        self._ready = threading.Event()
+
         global logger
         logger = logger if logging else null_logger
 
@@ -83,6 +93,7 @@ class AdsTestServer(threading.Thread):
     def __enter__(self) -> "AdsTestServer":
         """Enter context."""
         self.start()
+        self.wait_until_ready()
         return self
 
     def __exit__(self, exc_type: Optional[Type[BaseException]], exc_value: Optional[BaseException],
@@ -103,18 +114,33 @@ class AdsTestServer(threading.Thread):
             # Stop server loop execution
             self._run = False
 
+        self._ready.clear()
+
+        # Wait for the server loop to leave select, otherwise the socket
+        # stays bound until the select call times out
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join()
+
         self.server.close()
 
     def close(self) -> None:
         """Close the server thread."""
         self.stop()
 
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until the server accepts connections.
+
+        :param timeout: maximum time to wait in seconds, wait forever if None
+        :return: True if the server is ready, False on timeout
+
+        """
+        return self._ready.wait(timeout)
+
     def run(self) -> None:
         """Listen for incoming connections from clients."""
-        self._run = True
-
         # Start server listening
         self.server.listen(5)
+        self._ready.set()
 
         logger.info(
             "Server listening on {0}:{1}".format(
@@ -134,6 +160,10 @@ class AdsTestServer(threading.Thread):
                 except:
                     continue
 
+                # Send responses right away instead of waiting for the ACK of
+                # the previous response (Nagle), adslib does the same
+                client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
                 logger.info("New connection from {0}:{1}".format(*address))
 
                 # Delegate handling of connection to client thread
@@ -185,8 +215,6 @@ class AdsClientConnection(threading.Thread):
 
     def run(self) -> None:
         """Listen for data on client connection and delegate requests."""
-        self._run = True
-
         # Main listening loop
         while self._run:
             ready, _, _ = select.select([self.client], [], [], 0.1)
@@ -231,7 +259,9 @@ class AdsClientConnection(threading.Thread):
             logger.error("Request handler failed to return a valid response.")
 
     @staticmethod
-    def construct_response(response_data: AmsResponseData, request: AmsPacket) -> bytes:
+    def construct_response(
+        response_data: AmsResponseData, request: AmsPacket
+    ) -> bytearray:
         """Construct binary AMS response to return to the client.
 
         :param AmsResponseData response_data: Data to include in the response
@@ -251,37 +281,32 @@ class AdsClientConnection(threading.Thread):
         # Use state flags as specified in response data
         state_flags = response_data.state_flags
 
-        # Calculate payload length and unpack to binary data
-        ams_length = struct.pack("<I", len(response_data.data))
-
         # Use error code specified in response data
         error_code = response_data.error_code
 
         data = response_data.data
-
-        # Below we [ab]use `encode` to get a py2/3 compatible binary object
-        # (str in py2, or bytes in py3)
-
-        # Concatenate ams header data into single binary object
-        ams_header = "".encode("utf-8").join(
-            (
-                target_net_id,
-                target_port,
-                source_net_id,
-                source_port,
-                command_id,
-                state_flags,
-                ams_length,
-                error_code,
-                invoke_id,
-                data,
-            )
+        header_size = _AMS_RESPONSE_HEADER.size
+
+        # Write AMS/TCP header, AMS header and data into a single buffer, the
+        # AMS/TCP length covers the 32 byte AMS header and the data
+        response = bytearray(header_size + len(data))
+        _AMS_RESPONSE_HEADER.pack_into(
+            response,
+            0,
+            header_size - 6 + len(data),
+            target_net_id,
+            target_port,
+            source_net_id,
+            source_port,
+            command_id,
+            state_flags,
+            len(data),
+            error_code,
+            invoke_id,
         )
+        response[header_size:] = data
 
-        ams_tcp_header = "\x00\x00".encode("utf-8") + struct.pack("<I", len(
-            ams_header))
-
-        return ams_tcp_header + ams_header
+        return response
 
     @staticmethod
     def construct_request(request_bytes: bytes) -> AmsPacket:
@@ -292,24 +317,34 @@ class AdsClientConnection(threading.Thread):
         :return: AmsPacket with fields populated from the binary data
 
         """
-        data = request_bytes  # Use a shorter name for brevity
-
-        tcp_header = AmsTcpHeader(data[2:6])
+        # Extract the AMS/TCP length, the target/source net ID's and ports,
+        # command ID, state flags, data length, error code and invoke ID
+        (
+            tcp_length,
+            target_net_id,
+            target_port,
+            source_net_id,
+            source_port,
+            command_id,
+            state_flags,
+            length,
+            error_code,
+            invoke_id,
+        ) = _AMS_PACKET_HEADER.unpack_from(request_bytes)
+
+        tcp_header = AmsTcpHeader(tcp_length)
 
         ams_header = AmsHeader(
-            # Extract target/source net ID's and ports
-            data[6:12],
-            data[12:14],
-            data[14:20],
-            data[20:22],
-            # Extract command ID, state flags, and data length
-            data[22:24],
-            data[24:26],
-            data[26:30],
-            # Extract error code, invoke ID, and data
-            data[30:34],
-            data[34:38],
-            data[38:],
+            target_net_id,
+            target_port,
+            source_net_id,
+            source_port,
+            command_id,
+            state_flags,
+            length,
+            error_code,
+            invoke_id,
+            request_bytes[_AMS_PACKET_HEADER.size:],
         )
 
         return AmsPacket(tcp_header, ams_header)
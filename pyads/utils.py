@@ -61,14 +61,14 @@ def decode_ads(message: bytes) -> str:
     return message.decode("windows-1252").strip(" \t\n\r\0")
 
 
-def find_wstring_null_terminator(data: bytearray) -> Optional[int]:
+def find_wstring_null_terminator(data: bytes) -> Optional[int]:
     """Find null-terminator in WSTRING (UTF-16) data.
 
     :return: None if no null-terminator was found, else the index of the null-terminator
 
     """
-    for ix in range(1, len(data), 2):
-        if (data[ix - 1], data[ix]) == (0, 0):
-            return ix - 1
-    else:
-        return None
+    # Let bytes.find do the scan, but skip matches that straddle two characters
+    ix = data.find(b"\x00\x00")
+    while ix != -1 and ix % 2:
+        ix = data.find(b"\x00\x00", ix + 1)
+    return None if ix == -1 else ix
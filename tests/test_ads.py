@@ -843,10 +843,31 @@ class AdsTest(unittest.TestCase):
         )
         # fmt: off
         bytes_list = [29] + subbytes_list + subbytes_list
-    
+
         # fmt: on
         self.assertEqual(bytes_list, pyads.bytes_from_dict(values, structure_def))
 
+    def test_bytes_from_dict_string_too_long(self) -> None:
+        """Test bytes_from_dict with strings longer than their declared size"""
+        # strings exceeding their size are written as is, without padding
+        cases = (
+            (pyads.PLCTYPE_STRING, "abcdef".encode("utf-8")),
+            (pyads.PLCTYPE_WSTRING, "abcdef".encode("utf-16-le")),
+        )
+        for plc_datatype, expected in cases:
+            with self.subTest(plc_datatype=plc_datatype.__name__):
+                structure_def = (("sVar", plc_datatype, 1, 3),)
+                values = OrderedDict([("sVar", "abcdef")])
+                self.assertEqual(
+                    list(expected), pyads.bytes_from_dict(values, structure_def)
+                )
+
+                structure_def = (("sVar", plc_datatype, 2, 3),)
+                values = OrderedDict([("sVar", ["abcdef", "abcdef"])])
+                self.assertEqual(
+                    2 * list(expected), pyads.bytes_from_dict(values, structure_def)
+                )
+
     def test_dict_slice_generator(self):
         """test _dict_slice_generator function."""
         test_dict = {
@@ -902,6 +923,27 @@ class AdsTest(unittest.TestCase):
         self.assertEqual(split_list, expected)
         split_list.clear()
 
+    def test_get_value_from_ctype_data_array(self):
+        """test get_value_from_ctype_data function with arrays."""
+        get_value = pyads.pyads_ex.get_value_from_ctype_data
+
+        arrays = (
+            (pyads.constants.PLCTYPE_ARR_INT(5), [-2, -1, 0, 1, 2]),
+            (pyads.constants.PLCTYPE_ARR_UDINT(3), [0, 1, 0xFFFFFFFF]),
+            (pyads.constants.PLCTYPE_ARR_LREAL(2), [0.5, -1.25]),
+            (pyads.constants.PLCTYPE_ARR_BOOL(3), [True, False, True]),
+        )
+        for plc_type, values in arrays:
+            with self.subTest(plc_type=plc_type):
+                value = get_value(plc_type(*values), plc_type)
+                self.assertEqual(value, values)
+                self.assertIsInstance(value[0], type(values[0]))
+
+        # Multidimensional arrays keep their rows as ctypes arrays
+        plc_type = pyads.constants.PLCTYPE_ARR_INT(2) * 2
+        value = get_value(plc_type((1, 2), (3, 4)), plc_type)
+        self.assertEqual([list(row) for row in value], [[1, 2], [3, 4]])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,13 +7,13 @@
 
 """
 import ctypes
-from ctypes import addressof, memmove, resize, sizeof, pointer
+from ctypes import addressof, byref, memmove, sizeof, string_at, POINTER
 import datetime
-import time
 import unittest
 import pyads
 import struct
-from pyads.testserver import AdsTestServer, AmsPacket, AdvancedHandler, PLCVariable
+from typing import Any, Dict, List, Optional, Type
+from pyads.testserver import AdsTestServer, AmsPacket, AdvancedHandler, BasicHandler, PLCVariable
 from pyads.structs import NotificationAttrib
 from pyads import constants, structs, PLC_DEFAULT_STRING_SIZE
 from collections import OrderedDict
@@ -23,65 +23,161 @@ TEST_SERVER_AMS_NET_ID = "127.0.0.1.1.1"
 TEST_SERVER_IP_ADDRESS = "127.0.0.1"
 TEST_SERVER_AMS_PORT = pyads.PORT_SPS1
 
+# Offset of the notification data behind hNotification, nTimeStamp and cbSampleSize
+NOTIFICATION_DATA_OFFSET = structs.SAdsNotificationHeader.data.offset
+
+# Precompiled formats of the values exchanged with the testserver
+_U32LE = struct.Struct("<I")
+_5U32LE = struct.Struct("<IIIII")
+_5I16LE = struct.Struct("<hhhhh")
+_F32LE = struct.Struct("<f")
+_F64LE = struct.Struct("<d")
+
+# Values the basic handler returns for reads: repeated 0x0F terminated with 0x00
+EXPECTED_ARR_INT5 = _5I16LE.unpack(b"\x0F" * 9 + b"\x00")
+EXPECTED_UDINT = _U32LE.unpack(b"\x0F\x0F\x0F\x00")[0]
+# The string buffer is 1024 bytes long, the \x00 gets chopped off during parsing
+EXPECTED_STRING = "\x0F" * 1023
+
+# Pointer type passed to notification callbacks
+LP_SAdsNotificationHeader = POINTER(structs.SAdsNotificationHeader)
+
+
+# SAdsNotificationHeader subclasses with room for the payload, keyed by payload size
+_notification_struct_types = {}  # type: Dict[int, Type[structs.SAdsNotificationHeader]]
+
+
+def notification_struct_type(payload_size: int) -> \
+        Type[structs.SAdsNotificationHeader]:
+    """Get notification structure type holding `payload_size` data bytes"""
+    struct_type = _notification_struct_types.get(payload_size)
+    if struct_type is None:
+        # The first payload byte is held by the `data` field of the header
+        struct_type = type(
+            "SAdsNotificationHeader{}".format(payload_size),
+            (structs.SAdsNotificationHeader,),
+            {"_pack_": 1, "_fields_": [("tail", ctypes.c_ubyte * max(payload_size - 1, 0))]},
+        )
+        _notification_struct_types[payload_size] = struct_type
+    return struct_type
+
 
 def create_notification_struct(payload: bytes) -> \
         structs.SAdsNotificationHeader:
     """Create notification callback structure"""
-    buf = b"\x00" * 12  # hNotification, nTimeStamp
-    buf += struct.pack("<i", len(payload))
-    buf += payload
-    notification = structs.SAdsNotificationHeader()
-    resize(notification, len(buf))
-    memmove(
-        pointer(notification),
-        (ctypes.c_ubyte * len(buf)).from_buffer_copy(buf),
-        sizeof(notification),
-    )
+    notification = notification_struct_type(len(payload))()
+    notification.cbSampleSize = len(payload)
+    memmove(byref(notification, NOTIFICATION_DATA_OFFSET), payload, len(payload))
     return notification
 
 
+def ctypes_to_bytes(obj: Any) -> bytes:
+    """Copy the raw memory of a ctypes object into a bytes object"""
+    return string_at(addressof(obj), sizeof(obj))
+
+
+def decode_c_string(data: bytes, offset: int) -> str:
+    """Decode the null terminated string starting at `offset`"""
+    return data[offset:data.index(b"\x00", offset)].decode("utf-8")
+
+
 class _Struct(ctypes.Structure):
     _fields_ = [("x", ctypes.c_int32), ("y", ctypes.c_int32)]
 
 
+# Values written by the struct and array write tests, never modified
+WRITE_STRUCT = _Struct(-123, 456)
+WRITE_ARRAY = tuple(range(5))
+
+# Pythons internal representation of a float has a higher precision than
+# 32 bits, so the written REAL is compared with the value packed to 32 bits
+WRITE_FLOAT = 123.456
+WRITE_FLOAT_F32 = _F32LE.pack(WRITE_FLOAT)
+
+# Variable name of the by name tests as sent to the server, null terminated
+TEST_HANDLE_NAME = "TestHandle"
+TEST_HANDLE_NAME_BYTES = TEST_HANDLE_NAME.encode("utf-8") + b"\x00"
+
+# Notification attributes are only read when adding a notification
+NOTIFICATION_ATTR4 = NotificationAttrib(length=4)
+
+# Structure definitions of the read/write structure by name tests
+READ_STRUCTURE_DEF = (("xVar", pyads.PLCTYPE_BYTE, 1),)
+READ_STRUCTURE_SIZE = pyads.size_of_structure(READ_STRUCTURE_DEF)
+WRITE_STRUCTURE_DEF = (("sVar", pyads.PLCTYPE_STRING, 1),)
+WRITE_STRUCTURE_SIZE = pyads.size_of_structure(WRITE_STRUCTURE_DEF)
+
+
+test_server = None  # type: Optional[AdsTestServer]
+
+
+def setUpModule():
+    # type: () -> None
+    """Setup the ADS testserver shared by all testcases of this module."""
+    global test_server
+    test_server = AdsTestServer(logging=False)
+    test_server.start()
+    if not test_server.wait_until_ready(timeout=1):
+        raise RuntimeError("Testserver does not accept connections")
+
+
+def tearDownModule():
+    # type: () -> None
+    """Tear down the testserver."""
+    test_server.stop()
+
+
 class AdsConnectionClassTestCase(unittest.TestCase):
     """Testcase for ADS connection class."""
 
     @classmethod
     def setUpClass(cls):
         # type: () -> None
-        """Setup the ADS testserver."""
-        cls.test_server = AdsTestServer(logging=False)
-        cls.test_server.start()
-
-        # wait a bit otherwise error might occur
-        time.sleep(1)
+        """Use the shared testserver with the basic handler."""
+        cls.test_server = test_server
+        cls.test_server.handler = BasicHandler()
+        cls.plc = pyads.Connection(
+            TEST_SERVER_AMS_NET_ID, TEST_SERVER_AMS_PORT, TEST_SERVER_IP_ADDRESS
+        )
+        cls.plc.open()
 
     @classmethod
     def tearDownClass(cls):
         # type: () -> None
-        """Tear down the testserver."""
-        cls.test_server.stop()
-
-        # wait a bit for server to shutdown
-        time.sleep(1)
+        """Close the shared connection."""
+        cls.plc.close()
 
     def setUp(self):
         # type: () -> None
-        """Establish connection to the testserver."""
-        self.test_server.request_history = []
-        self.plc = pyads.Connection(
-            TEST_SERVER_AMS_NET_ID, TEST_SERVER_AMS_PORT, TEST_SERVER_IP_ADDRESS
-        )
+        """Reset the shared connection to the testserver."""
+        self.test_server.request_history.clear()
+        # reopen if the previous test closed the connection
+        self.plc.open()
+        self.plc._symbol_info_cache.clear()
 
     def assert_command_id(self, request, target_id):
         # type: (AmsPacket, int) -> None
         """Assert command_id and target_id."""
         # Check the request code received by the server
-        command_id = request.ams_header.command_id
-        command_id = struct.unpack("<H", command_id)[0]
+        command_id = int.from_bytes(request.ams_header.command_id, "little")
         self.assertEqual(command_id, target_id)
 
+    def expect_requests(self, *command_ids):
+        # type: (int) -> List[AmsPacket]
+        """Assert the server received exactly the given commands in order.
+
+        Return the request history for further checks on the request data.
+
+        """
+        requests = self.test_server.request_history
+        # compare all command ids at once, this also checks the request count
+        received_ids = [
+            int.from_bytes(request.ams_header.command_id, "little")
+            for request in requests
+        ]
+        self.assertEqual(received_ids, list(command_ids))
+        return requests
+
     def test_initialization(self):
         # type: () -> None
         """Test init process."""
@@ -116,224 +212,121 @@ class AdsConnectionClassTestCase(unittest.TestCase):
         self.assertFalse(self.plc.is_open)
 
     def test_netid_port(self):
-        self.assertEqual(self.plc.ams_netid, TEST_SERVER_AMS_NET_ID)
-        self.assertEqual(self.plc.ams_port, TEST_SERVER_AMS_PORT)
+        # use a separate connection as netid and port get modified
+        plc = pyads.Connection(
+            TEST_SERVER_AMS_NET_ID, TEST_SERVER_AMS_PORT, TEST_SERVER_IP_ADDRESS
+        )
+        self.assertEqual(plc.ams_netid, TEST_SERVER_AMS_NET_ID)
+        self.assertEqual(plc.ams_port, TEST_SERVER_AMS_PORT)
         with self.assertRaises(ValueError):
-            self.plc.ams_netid = "1.1.1.1.1.1.1"
-        self.plc.ams_netid = "1.1.1.1.1.1"
-        self.assertEqual(self.plc.ams_netid, "1.1.1.1.1.1")
-        self.plc.ams_port = 1
-        self.assertEqual(self.plc.ams_port, 1)
+            plc.ams_netid = "1.1.1.1.1.1.1"
+        plc.ams_netid = "1.1.1.1.1.1"
+        self.assertEqual(plc.ams_netid, "1.1.1.1.1.1")
+        plc.ams_port = 1
+        self.assertEqual(plc.ams_port, 1)
 
         # test for AttributeError when trying to set netid or port
         # for an open connection
-        self.plc._open = True
+        plc._open = True
         with self.assertRaises(AttributeError):
-            self.plc.ams_netid = "1.1.1.1.1.2"
+            plc.ams_netid = "1.1.1.1.1.2"
         with self.assertRaises(AttributeError):
-            self.plc.ams_port = 2
+            plc.ams_port = 2
+        plc._open = False
 
     def test_read_array(self):
         # Make request to read array data from a random index (the test server will
         # return the same thing regardless)
-        with self.plc:
-            result = self.plc.read(
-                index_group=constants.INDEXGROUP_DATA,
-                index_offset=1,
-                plc_datatype=constants.PLCTYPE_ARR_INT(5),
-            )
-
-            # Retrieve list of received requests from server
-            requests = self.test_server.request_history
-
-            # Assert that the server received a request
-            self.assertEqual(len(requests), 1)
-
-            # Assert that the server received the correct command
-            self.assert_command_id(requests[0], constants.ADSCOMMAND_READ)
+        result = self.plc.read(
+            index_group=constants.INDEXGROUP_DATA,
+            index_offset=1,
+            plc_datatype=constants.PLCTYPE_ARR_INT(5),
+        )
 
-            # The string buffer is 1024 bytes long, this will be filled with \x0F
-            # and null terminated with \x00 by our test server. The \x00 will get
-            # chopped off during parsing to python string type
-            expected_result = list(struct.unpack("<hhhhh", b"\x0F" * 9 + b"\x00"))
+        self.expect_requests(constants.ADSCOMMAND_READ)
 
-            self.assertEqual(result, expected_result)
+        # The string buffer is 1024 bytes long, this will be filled with \x0F
+        # and null terminated with \x00 by our test server. The \x00 will get
+        # chopped off during parsing to python string type
+        self.assertEqual(result, list(EXPECTED_ARR_INT5))
 
     def test_read_array_return_ctypes(self):
         # Make request to read array data from a random index (the test server will
         # return the same thing regardless)
-        with self.plc:
-            result = self.plc.read(
-                index_group=constants.INDEXGROUP_DATA,
-                index_offset=1,
-                plc_datatype=constants.PLCTYPE_ARR_INT(5),
-                return_ctypes=True,
-            )
-
-            # Retrieve list of received requests from server
-            requests = self.test_server.request_history
-
-            # Assert that the server received a request
-            self.assertEqual(len(requests), 1)
-
-            # Assert that the server received the correct command
-            self.assert_command_id(requests[0], constants.ADSCOMMAND_READ)
-
-            # The string buffer is 1024 bytes long, this will be filled with \x0F
-            # and null terminated with \x00 by our test server. The \x00 will get
-            # chopped off during parsing to python string type
-            expected_result_raw = b"\x0F" * 9 + b"\x00"
-            expected_result = list(struct.unpack("<hhhhh", expected_result_raw))
-            self.assertEqual([x for x in result], expected_result)
-
-    def test_read_device_info(self):
-        with self.plc:
-            name, version = self.plc.read_device_info()
-            requests = self.test_server.request_history
-
-            self.assertEqual(len(requests), 1)
-            self.assert_command_id(requests[0], constants.ADSCOMMAND_READDEVICEINFO)
-
-    def test_read_uint(self):
-        with self.plc:
-            result = self.plc.read(pyads.INDEXGROUP_DATA, 1, pyads.PLCTYPE_UDINT)
-
-            # Retrieve list of received requests from server
-            requests = self.test_server.request_history
-
-            # Assert that the server received a request
-            self.assertEqual(len(requests), 1)
-
-            # Assert that the server received the correct command
-            self.assert_command_id(requests[0], constants.ADSCOMMAND_READ)
-
-            # Test server just returns repeated bytes of 0x0F terminated with 0x00
-            expected_result = struct.unpack("<I", "\x0F\x0F\x0F\x00".encode("utf-8"))[0]
-
-            self.assertEqual(result, expected_result)
-
-    def test_read_string(self):
-        # Make request to read data from a random index (the test server will
-        # return the same thing regardless)
-        with self.plc:
-            result = self.plc.read(
-                index_group=constants.INDEXGROUP_DATA,
-                index_offset=1,
-                plc_datatype=constants.PLCTYPE_STRING,
-            )
-
-        # Retrieve list of received requests from server
-        requests = self.test_server.request_history
-
-        # Assert that the server received a request
-        self.assertEqual(len(requests), 1)
+        result = self.plc.read(
+            index_group=constants.INDEXGROUP_DATA,
+            index_offset=1,
+            plc_datatype=constants.PLCTYPE_ARR_INT(5),
+            return_ctypes=True,
+        )
 
-        # Assert that the server received the correct command
-        self.assert_command_id(requests[0], constants.ADSCOMMAND_READ)
+        self.expect_requests(constants.ADSCOMMAND_READ)
 
         # The string buffer is 1024 bytes long, this will be filled with \x0F
         # and null terminated with \x00 by our test server. The \x00 will get
         # chopped off during parsing to python string type
-        expected_result = "\x0F" * 1023
-        self.assertEqual(result, expected_result)
-
-    def test_write_uint(self):
-        value = 100
-
-        with self.plc:
-            self.plc.write(
-                index_group=constants.INDEXGROUP_DATA,
-                index_offset=1,
-                value=value,
-                plc_datatype=constants.PLCTYPE_UDINT,
-            )
+        self.assertEqual(list(result), list(EXPECTED_ARR_INT5))
 
-        # Retrieve list of received requests from server
-        requests = self.test_server.request_history
-
-        # Assert that the server received a request
-        self.assertEqual(len(requests), 1)
-
-        # Assert that the server received the correct command
-        self.assert_command_id(requests[0], constants.ADSCOMMAND_WRITE)
-
-        # Check the value received by the server
-        received_value = struct.unpack("<I", requests[0].ams_header.data[12:])[0]
-
-        self.assertEqual(value, received_value)
-
-    def test_write_float(self):
-        value = 123.456
-
-        with self.plc:
-            self.plc.write(
-                index_group=constants.INDEXGROUP_DATA,
-                index_offset=1,
-                value=value,
-                plc_datatype=constants.PLCTYPE_REAL,
-            )
-
-        # Retrieve list of received requests from server
-        requests = self.test_server.request_history
-
-        # Assert that the server received a request
-        self.assertEqual(len(requests), 1)
-
-        # Assert that the server received the correct command
-        self.assert_command_id(requests[0], constants.ADSCOMMAND_WRITE)
-
-        # Check the value received by the server
-        received_value = struct.unpack("<f", requests[0].ams_header.data[12:])[0]
-
-        # Pythons internal representation of a float has a higher precision
-        # than 32 bits, so will be more precise than the value received by the
-        # server. To do a comparison we must put the initial 'write' value
-        # through the round-trip of converting to 32-bit precision.
-        value_32 = struct.unpack("<f", struct.pack("<f", value))[0]
+    def test_read_device_info(self):
+        name, version = self.plc.read_device_info()
+        self.expect_requests(constants.ADSCOMMAND_READDEVICEINFO)
+
+    def test_read(self):
+        # The test server returns repeated bytes of 0x0F terminated with 0x00
+        # for every read. The string buffer is 1024 bytes long, the \x00 will
+        # get chopped off during parsing to python string type
+        cases = (
+            (constants.PLCTYPE_UDINT, EXPECTED_UDINT),
+            (constants.PLCTYPE_STRING, EXPECTED_STRING),
+        )
 
-        self.assertEqual(value_32, received_value)
+        for plc_datatype, expected_result in cases:
+            with self.subTest(plc_datatype=plc_datatype.__name__):
+                self.test_server.request_history.clear()
 
-    def test_write_string(self):
-        value = "Test String 1234."
+                # Make request to read data from a random index (the test
+                # server will return the same thing regardless)
+                result = self.plc.read(
+                    index_group=constants.INDEXGROUP_DATA,
+                    index_offset=1,
+                    plc_datatype=plc_datatype,
+                )
 
-        with self.plc:
-            self.plc.write(
-                index_group=constants.INDEXGROUP_DATA,
-                index_offset=1,
-                value=value,
-                plc_datatype=constants.PLCTYPE_STRING,
-            )
+                self.expect_requests(constants.ADSCOMMAND_READ)
 
-        # Retrieve list of received requests from server
-        requests = self.test_server.request_history
+                self.assertEqual(result, expected_result)
 
-        # Assert that the server received a request
-        self.assertEqual(len(requests), 1)
+    def test_write(self):
+        cases = (
+            (100, constants.PLCTYPE_UDINT, _U32LE.pack(100)),
+            # ctypes value of the matching type is passed on without conversion
+            (constants.PLCTYPE_UDINT(100), constants.PLCTYPE_UDINT, _U32LE.pack(100)),
+            (WRITE_FLOAT, constants.PLCTYPE_REAL, WRITE_FLOAT_F32),
+            # String should have been sent null terminated
+            ("Test String 1234.", constants.PLCTYPE_STRING, b"Test String 1234.\x00"),
+        )
 
-        # Assert that the server received the correct command
-        self.assert_command_id(requests[0], constants.ADSCOMMAND_WRITE)
+        for value, plc_datatype, sent_value in cases:
+            with self.subTest(value=value, plc_datatype=plc_datatype.__name__):
+                self.test_server.request_history.clear()
 
-        # Check the value received by the server
-        received_value = requests[0].ams_header.data[12:]
+                self.plc.write(
+                    index_group=constants.INDEXGROUP_DATA,
+                    index_offset=1,
+                    value=value,
+                    plc_datatype=plc_datatype,
+                )
 
-        # String should have been sent null terminated
-        sent_value = (value + "\x00").encode("utf-8")
+                requests = self.expect_requests(constants.ADSCOMMAND_WRITE)
 
-        self.assertEqual(sent_value, received_value)
+                # Check the value received by the server
+                self.assertEqual(sent_value, memoryview(requests[0].ams_header.data)[12:])
 
     def test_read_state(self):
 
-        with self.plc:
-            ads_state, device_state = self.plc.read_state()
-
-        # Retrieve list of received requests from server
-        requests = self.test_server.request_history
-
-        # Assert that the server received a request
-        self.assertEqual(len(requests), 1)
+        ads_state, device_state = self.plc.read_state()
 
-        # Assert that the server received the correct command
-        self.assert_command_id(requests[0], constants.ADSCOMMAND_READSTATE)
+        self.expect_requests(constants.ADSCOMMAND_READSTATE)
 
         # Test server should return 'running'
         self.assertEqual(ads_state, constants.ADSSTATE_RUN)
@@ -342,191 +335,164 @@ class AdsConnectionClassTestCase(unittest.TestCase):
         self.assertEqual(device_state, 0)
 
     def test_write_struct(self):
-        write_value = _Struct(-123, 456)
-        with self.plc:
-            self.plc.write(
-                index_group=constants.INDEXGROUP_DATA,
-                index_offset=1,
-                value=write_value,
-                plc_datatype=_Struct,
-            )
-            # Retrieve list of received requests from server
-            requests = self.test_server.request_history
-            # Check the value received by the server
-            received_value = _Struct.from_buffer_copy(requests[0].ams_header.data[12:])
-            self.assertEqual(write_value.x, received_value.x)
-            self.assertEqual(write_value.y, received_value.y)
+        write_value = WRITE_STRUCT
+        self.plc.write(
+            index_group=constants.INDEXGROUP_DATA,
+            index_offset=1,
+            value=write_value,
+            plc_datatype=_Struct,
+        )
+        # Retrieve list of received requests from server
+        requests = self.test_server.request_history
+        # Check the value received by the server
+        self.assertEqual(
+            requests[0].ams_header.data[12:12 + sizeof(_Struct)],
+            bytes(write_value),
+        )
 
     def test_write_array(self):
-        write_value = tuple(range(5))
-        with self.plc:
-            self.plc.write(
-                index_group=constants.INDEXGROUP_DATA,
-                index_offset=1,
-                value=write_value,
-                plc_datatype=constants.PLCTYPE_UDINT * 5,
-            )
+        write_value = WRITE_ARRAY
+        self.plc.write(
+            index_group=constants.INDEXGROUP_DATA,
+            index_offset=1,
+            value=write_value,
+            plc_datatype=constants.PLCTYPE_UDINT * 5,
+        )
 
-            # Retrieve list of received requests from server
-            requests = self.test_server.request_history
+        # Retrieve list of received requests from server
+        requests = self.test_server.request_history
 
-            # Check the value received by the server
-            received_value = struct.unpack("<IIIII", requests[0].ams_header.data[12:])
-            self.assertEqual(write_value, received_value)
+        # Check the value received by the server
+        self.assertEqual(len(requests[0].ams_header.data), 12 + _5U32LE.size)
+        received_value = _5U32LE.unpack_from(requests[0].ams_header.data, 12)
+        self.assertEqual(write_value, received_value)
 
     def test_write_control(self):
         # Set the ADS State to reset
         # Device state is unused I think? Always seems to be zero
-        with self.plc:
-            self.plc.write_control(
-                ads_state=constants.ADSSTATE_RESET,
-                device_state=0,
-                data=0,
-                plc_datatype=constants.PLCTYPE_BYTE,
-            )
-
-        # Retrieve list of received requests from server
-        requests = self.test_server.request_history
-
-        # Assert that the server received a request
-        self.assertEqual(len(requests), 1)
+        self.plc.write_control(
+            ads_state=constants.ADSSTATE_RESET,
+            device_state=0,
+            data=0,
+            plc_datatype=constants.PLCTYPE_BYTE,
+        )
 
-        # Assert that the server received the correct command
-        self.assert_command_id(requests[0], constants.ADSCOMMAND_WRITECTRL)
+        self.expect_requests(constants.ADSCOMMAND_WRITECTRL)
 
     def test_read_write(self):
         write_value = 100
 
-        with self.plc:
-            read_value = self.plc.read_write(
-                index_group=constants.INDEXGROUP_DATA,
-                index_offset=1,
-                plc_read_datatype=constants.PLCTYPE_UDINT,
-                value=write_value,
-                plc_write_datatype=constants.PLCTYPE_UDINT,
-            )
-
-        # Retrieve list of received requests from server
-        requests = self.test_server.request_history
-
-        # Assert that the server received a request
-        self.assertEqual(len(requests), 1)
+        read_value = self.plc.read_write(
+            index_group=constants.INDEXGROUP_DATA,
+            index_offset=1,
+            plc_read_datatype=constants.PLCTYPE_UDINT,
+            value=write_value,
+            plc_write_datatype=constants.PLCTYPE_UDINT,
+        )
 
-        # Assert that the server received the correct command
-        self.assert_command_id(requests[0], constants.ADSCOMMAND_READWRITE)
+        requests = self.expect_requests(constants.ADSCOMMAND_READWRITE)
 
         # Check the value received by the server
-        received_value = struct.unpack("<I", requests[0].ams_header.data[16:])[0]
+        self.assertEqual(len(requests[0].ams_header.data), 16 + _U32LE.size)
+        received_value = _U32LE.unpack_from(requests[0].ams_header.data, 16)[0]
         self.assertEqual(write_value, received_value)
 
         # Check read value returned by server:
         # Test server just returns repeated bytes of 0x0F terminated with 0x00
-        expected_result = struct.unpack("<I", "\x0F\x0F\x0F\x00".encode("utf-8"))[0]
-        self.assertEqual(read_value, expected_result)
+        self.assertEqual(read_value, EXPECTED_UDINT)
 
     def test_read_write_read_none(self):
         write_value = 100
 
-        with self.plc:
-            read_value = self.plc.read_write(
-                index_group=constants.INDEXGROUP_DATA,
-                index_offset=1,
-                plc_read_datatype=None,
-                value=write_value,
-                plc_write_datatype=constants.PLCTYPE_UDINT,
-            )
+        read_value = self.plc.read_write(
+            index_group=constants.INDEXGROUP_DATA,
+            index_offset=1,
+            plc_read_datatype=None,
+            value=write_value,
+            plc_write_datatype=constants.PLCTYPE_UDINT,
+        )
 
         # Retrieve list of received requests from server
         requests = self.test_server.request_history
 
         # Check the value received by the server
-        received_value = struct.unpack("<I", requests[0].ams_header.data[16:])[0]
+        self.assertEqual(len(requests[0].ams_header.data), 16 + _U32LE.size)
+        received_value = _U32LE.unpack_from(requests[0].ams_header.data, 16)[0]
         self.assertEqual(write_value, received_value)
         # Check nothing was to be read
-        read_size = struct.unpack("<I", requests[0].ams_header.data[8:12])[0]
+        read_size = _U32LE.unpack_from(requests[0].ams_header.data, 8)[0]
         self.assertEqual(read_size, 0)
         # Check return value
         self.assertIsNone(read_value)
 
     def test_read_write_write_none(self):
-        with self.plc:
-            read_value = self.plc.read_write(
-                index_group=constants.INDEXGROUP_DATA,
-                index_offset=1,
-                plc_read_datatype=constants.PLCTYPE_UDINT,
-                value=None,
-                plc_write_datatype=None,
-            )
+        read_value = self.plc.read_write(
+            index_group=constants.INDEXGROUP_DATA,
+            index_offset=1,
+            plc_read_datatype=constants.PLCTYPE_UDINT,
+            value=None,
+            plc_write_datatype=None,
+        )
 
         # Retrieve list of received requests from server
         requests = self.test_server.request_history
 
         # Check nothing was to be written
-        write_size = struct.unpack("<I", requests[0].ams_header.data[12:16])[0]
+        write_size = _U32LE.unpack_from(requests[0].ams_header.data, 12)[0]
         self.assertEqual(write_size, 0)
 
         # Check read value returned by server:
         # Test server just returns repeated bytes of 0x0F terminated with 0x00
-        expected_result = struct.unpack("<I", "\x0F\x0F\x0F\x00".encode("utf-8"))[0]
-        self.assertEqual(read_value, expected_result)
+        self.assertEqual(read_value, EXPECTED_UDINT)
 
     def test_read_write_array(self):
-        write_value = tuple(range(5))
-        with self.plc:
-            self.plc.read_write(
-                index_group=constants.INDEXGROUP_DATA,
-                index_offset=1,
-                plc_read_datatype=constants.PLCTYPE_UDINT,
-                value=write_value,
-                plc_write_datatype=constants.PLCTYPE_UDINT * 5,
-            )
-            # Retrieve list of received requests from server
-            requests = self.test_server.request_history
-            # Check the value received by the server
-            received_value = struct.unpack("<IIIII", requests[0].ams_header.data[16:])
-            self.assertEqual(write_value, received_value)
+        write_value = WRITE_ARRAY
+        self.plc.read_write(
+            index_group=constants.INDEXGROUP_DATA,
+            index_offset=1,
+            plc_read_datatype=constants.PLCTYPE_UDINT,
+            value=write_value,
+            plc_write_datatype=constants.PLCTYPE_UDINT * 5,
+        )
+        # Retrieve list of received requests from server
+        requests = self.test_server.request_history
+        # Check the value received by the server
+        self.assertEqual(len(requests[0].ams_header.data), 16 + _5U32LE.size)
+        received_value = _5U32LE.unpack_from(requests[0].ams_header.data, 16)
+        self.assertEqual(write_value, received_value)
 
     def test_read_write_struct(self):
-        write_value = _Struct(-123, 456)
-        with self.plc:
-            self.plc.read_write(
-                index_group=constants.INDEXGROUP_DATA,
-                index_offset=1,
-                plc_read_datatype=_Struct,
-                value=write_value,
-                plc_write_datatype=_Struct,
-            )
-            # Retrieve list of received requests from server
-            requests = self.test_server.request_history
-            # Check the value received by the server
-            received_value = _Struct.from_buffer_copy(requests[0].ams_header.data[16:])
-            self.assertEqual(write_value.x, received_value.x)
-            self.assertEqual(write_value.y, received_value.y)
+        write_value = WRITE_STRUCT
+        self.plc.read_write(
+            index_group=constants.INDEXGROUP_DATA,
+            index_offset=1,
+            plc_read_datatype=_Struct,
+            value=write_value,
+            plc_write_datatype=_Struct,
+        )
+        # Retrieve list of received requests from server
+        requests = self.test_server.request_history
+        # Check the value received by the server
+        self.assertEqual(
+            requests[0].ams_header.data[16:16 + sizeof(_Struct)],
+            bytes(write_value),
+        )
 
     def test_read_by_name(self):
-        handle_name = "TestHandle"
+        handle_name = TEST_HANDLE_NAME
 
-        with self.plc:
-            read_value = self.plc.read_by_name(handle_name, constants.PLCTYPE_BYTE)
-
-        # Retrieve list of received requests from server
-        requests = self.test_server.request_history
+        read_value = self.plc.read_by_name(handle_name, constants.PLCTYPE_BYTE)
 
         # Assert that the server received 3 requests
-        self.assertEqual(len(requests), 3)
+        requests = self.expect_requests(
+            constants.ADSCOMMAND_READWRITE,  # get handle by name
+            constants.ADSCOMMAND_READ,  # read value
+            constants.ADSCOMMAND_WRITE,  # release handle
+        )
 
-        # Assert that Read/Write command was used to get the handle by name
-        self.assert_command_id(requests[0], constants.ADSCOMMAND_READWRITE)
         # Assert that the server received the handle by name
-        received_value = requests[0].ams_header.data[16:]
-        sent_value = (handle_name + "\x00").encode("utf-8")
-        self.assertEqual(sent_value, received_value)
-
-        # Assert that next, the Read command was used to get the value
-        self.assert_command_id(requests[1], constants.ADSCOMMAND_READ)
-
-        # Assert that Write was used to release the handle
-        self.assert_command_id(requests[2], constants.ADSCOMMAND_WRITE)
+        received_value = memoryview(requests[0].ams_header.data)[16:]
+        self.assertEqual(TEST_HANDLE_NAME_BYTES, received_value)
 
         # Check read value returned by server:
         # Test server just returns repeated bytes of 0x0F terminated with 0x00
@@ -537,12 +503,11 @@ class AdsConnectionClassTestCase(unittest.TestCase):
     def test_read_by_name_with_handle(self):
         # type: () -> None
         """Test read_by_name method with handle passed in"""
-        handle_name = "TestHandle"
-        with self.plc:
-            handle = self.plc.get_handle(handle_name)
-            read_value = self.plc.read_by_name(
-                "", constants.PLCTYPE_BYTE, handle=handle
-            )
+        handle_name = TEST_HANDLE_NAME
+        handle = self.plc.get_handle(handle_name)
+        read_value = self.plc.read_by_name(
+            "", constants.PLCTYPE_BYTE, handle=handle
+        )
 
         # Retrieve list of received requests from server
         requests = self.test_server.request_history
@@ -551,9 +516,8 @@ class AdsConnectionClassTestCase(unittest.TestCase):
         self.assertEqual(len(requests), 2)
 
         # Assert that the server received the handle by name
-        received_value = requests[0].ams_header.data[16:]
-        sent_value = (handle_name + "\x00").encode("utf-8")
-        self.assertEqual(sent_value, received_value)
+        received_value = memoryview(requests[0].ams_header.data)[16:]
+        self.assertEqual(TEST_HANDLE_NAME_BYTES, received_value)
 
         # Assert that next, the Read command was used to get the value
         self.assert_command_id(requests[1], constants.ADSCOMMAND_READ)
@@ -564,39 +528,29 @@ class AdsConnectionClassTestCase(unittest.TestCase):
         expected_result = 0
         self.assertEqual(read_value, expected_result)
 
-        with self.plc:
-            self.plc.release_handle(handle)
+        self.plc.release_handle(handle)
 
     def test_read_structure_by_name(self):
         # type: () -> None
         """Test read by structure method"""
 
-        handle_name = "TestHandle"
+        handle_name = TEST_HANDLE_NAME
 
-        structure_def = (("xVar", pyads.PLCTYPE_BYTE, 1),)
+        structure_def = READ_STRUCTURE_DEF
 
         # test with no structure size passed in
-        with self.plc:
-            read_value = self.plc.read_structure_by_name(handle_name, structure_def)
-
-        # Retrieve list of received requests from server
-        requests = self.test_server.request_history
+        read_value = self.plc.read_structure_by_name(handle_name, structure_def)
 
         # Assert that the server received 3 requests
-        self.assertEqual(len(requests), 3)
+        requests = self.expect_requests(
+            constants.ADSCOMMAND_READWRITE,  # get handle by name
+            constants.ADSCOMMAND_READ,  # read value
+            constants.ADSCOMMAND_WRITE,  # release handle
+        )
 
-        # Assert that Read/Write command was used to get the handle by name
-        self.assert_command_id(requests[0], constants.ADSCOMMAND_READWRITE)
         # Assert that the server received the handle by name
-        received_value = requests[0].ams_header.data[16:]
-        sent_value = (handle_name + "\x00").encode("utf-8")
-        self.assertEqual(sent_value, received_value)
-
-        # Assert that next, the Read command was used to get the value
-        self.assert_command_id(requests[1], constants.ADSCOMMAND_READ)
-
-        # Assert that Write was used to release the handle
-        self.assert_command_id(requests[2], constants.ADSCOMMAND_WRITE)
+        received_value = memoryview(requests[0].ams_header.data)[16:]
+        self.assertEqual(TEST_HANDLE_NAME_BYTES, received_value)
 
         # Check read value returned by server:
         # Test server just returns repeated bytes of 0x0F terminated with 0x00
@@ -605,139 +559,110 @@ class AdsConnectionClassTestCase(unittest.TestCase):
         self.assertEqual(read_value, expected_result)
 
         # Test with structure size passed in
-        structure_size = pyads.size_of_structure(structure_def)
-        with self.plc:
-            read_value = self.plc.read_structure_by_name(
-                handle_name, structure_def, structure_size=structure_size
-            )
+        read_value = self.plc.read_structure_by_name(
+            handle_name, structure_def, structure_size=READ_STRUCTURE_SIZE
+        )
         self.assertEqual(read_value, expected_result)
 
         # Test with handle passed in
-        with self.plc:
-            handle = self.plc.get_handle(handle_name)
-            read_value = self.plc.read_structure_by_name(
-                "", structure_def, handle=handle
-            )
+        handle = self.plc.get_handle(handle_name)
+        read_value = self.plc.read_structure_by_name(
+            "", structure_def, handle=handle
+        )
         self.assertEqual(read_value, expected_result)
-        with self.plc:
-            self.plc.release_handle(handle)
+        self.plc.release_handle(handle)
 
     def test_write_by_name(self):
-        handle_name = "TestHandle"
+        handle_name = TEST_HANDLE_NAME
         value = "Test Value"
 
         # return None if connection is closed
+        self.plc.close()
         self.assertIsNone(self.plc.write_by_name("test_var", 1, pyads.PLCTYPE_INT))
+        self.plc.open()
 
-        with self.plc:
-            self.plc.write_by_name(handle_name, value, constants.PLCTYPE_STRING)
-
-        # Retrieve list of received requests from server
-        requests = self.test_server.request_history
+        self.plc.write_by_name(handle_name, value, constants.PLCTYPE_STRING)
 
         # Assert that the server received 3 requests
-        self.assertEqual(len(requests), 3)
-
-        # Assert that Read/Write command was used to get the handle by name
-        self.assert_command_id(requests[0], constants.ADSCOMMAND_READWRITE)
+        requests = self.expect_requests(
+            constants.ADSCOMMAND_READWRITE,  # get handle by name
+            constants.ADSCOMMAND_WRITE,  # write value
+            constants.ADSCOMMAND_WRITE,  # release handle
+        )
 
-        # Assert that Write command was used to write the value
-        self.assert_command_id(requests[1], constants.ADSCOMMAND_WRITE)
         # Check the value written matches our value
-        received_value = requests[1].ams_header.data[12:].decode("utf-8").rstrip("\x00")
+        received_value = decode_c_string(requests[1].ams_header.data, 12)
         self.assertEqual(value, received_value)
 
-        # Assert that Write was used to release the handle
-        self.assert_command_id(requests[2], constants.ADSCOMMAND_WRITE)
-
     def test_write_by_name_with_handle(self):
         # type: () -> None
         """Test write_by_name method with handle passed in"""
-        handle_name = "TestHandle"
+        handle_name = TEST_HANDLE_NAME
         value = "Test Value"
 
-        with self.plc:
-            handle = self.plc.get_handle(handle_name)
-            self.plc.write_by_name("", value, constants.PLCTYPE_STRING, handle=handle)
-
-        # Retrieve list of received requests from server
-        requests = self.test_server.request_history
+        handle = self.plc.get_handle(handle_name)
+        self.plc.write_by_name("", value, constants.PLCTYPE_STRING, handle=handle)
 
         # Assert that the server received 2 requests
-        self.assertEqual(len(requests), 2)
-
-        # Assert that Read/Write command was used to get the handle by name
-        self.assert_command_id(requests[0], constants.ADSCOMMAND_READWRITE)
+        requests = self.expect_requests(
+            constants.ADSCOMMAND_READWRITE,  # get handle by name
+            constants.ADSCOMMAND_WRITE,  # write value
+        )
 
-        # Assert that Write command was used to write the value
-        self.assert_command_id(requests[1], constants.ADSCOMMAND_WRITE)
         # Check the value written matches our value
-        received_value = requests[1].ams_header.data[12:].decode("utf-8").rstrip("\x00")
+        received_value = decode_c_string(requests[1].ams_header.data, 12)
         self.assertEqual(value, received_value)
 
-        with self.plc:
-            self.plc.release_handle(handle)
+        self.plc.release_handle(handle)
 
     def test_write_structure_by_name(self):
         # type: () -> None
         """Test write by structure method"""
 
-        handle_name = "TestHandle"
+        handle_name = TEST_HANDLE_NAME
         struct_to_write = OrderedDict([("sVar", "Test Value")])
         value = "Test Value"
 
-        structure_def = (("sVar", pyads.PLCTYPE_STRING, 1),)
+        structure_def = WRITE_STRUCTURE_DEF
 
         # test with no structure size passed in
-        with self.plc:
-            self.plc.write_structure_by_name(
-                handle_name, struct_to_write, structure_def
-            )
-
-        # Retrieve list of received requests from server
-        requests = self.test_server.request_history
+        self.plc.write_structure_by_name(
+            handle_name, struct_to_write, structure_def
+        )
 
         # Assert that the server received 3 requests
-        self.assertEqual(len(requests), 3)
-
-        # Assert that Read/Write command was used to get the handle by name
-        self.assert_command_id(requests[0], constants.ADSCOMMAND_READWRITE)
+        requests = self.expect_requests(
+            constants.ADSCOMMAND_READWRITE,  # get handle by name
+            constants.ADSCOMMAND_WRITE,  # write value
+            constants.ADSCOMMAND_WRITE,  # release handle
+        )
 
-        # Assert that Write command was used to write the value
-        self.assert_command_id(requests[1], constants.ADSCOMMAND_WRITE)
         # Check the value written matches our value
-        received_value = requests[1].ams_header.data[12:].decode("utf-8").rstrip("\x00")
+        received_value = decode_c_string(requests[1].ams_header.data, 12)
         self.assertEqual(value, received_value)
 
-        # Assert that Write was used to release the handle
-        self.assert_command_id(requests[2], constants.ADSCOMMAND_WRITE)
-
         # Test with structure size passed in
-        structure_size = pyads.size_of_structure(structure_def)
-        with self.plc:
-            self.plc.write_structure_by_name(
-                handle_name,
-                struct_to_write,
-                structure_def,
-                structure_size=structure_size,
-            )
+        self.plc.write_structure_by_name(
+            handle_name,
+            struct_to_write,
+            structure_def,
+            structure_size=WRITE_STRUCTURE_SIZE,
+        )
 
         requests = self.test_server.request_history
-        received_value = requests[1].ams_header.data[12:].decode("utf-8").rstrip("\x00")
+        received_value = decode_c_string(requests[1].ams_header.data, 12)
         self.assertEqual(value, received_value)
 
         # Test with handle passed in
-        with self.plc:
-            handle = self.plc.get_handle(handle_name)
-            self.plc.write_structure_by_name(
-                "", struct_to_write, structure_def, handle=handle
-            )
+        handle = self.plc.get_handle(handle_name)
+        self.plc.write_structure_by_name(
+            "", struct_to_write, structure_def, handle=handle
+        )
 
         requests = self.test_server.request_history
-        received_value = requests[1].ams_header.data[12:].decode("utf-8").rstrip("\x00")
+        received_value = decode_c_string(requests[1].ams_header.data, 12)
         self.assertEqual(value, received_value)
-        with self.plc:
-            self.plc.release_handle(handle)
+        self.plc.release_handle(handle)
 
     def test_device_notification(self):
         def callback(notification, data):
@@ -745,44 +670,37 @@ class AdsConnectionClassTestCase(unittest.TestCase):
 
         handle_name = "test"
         attr = pyads.NotificationAttrib(8)
-        requests = self.test_server.request_history
-
-        with self.plc:
-            notification, user = self.plc.add_device_notification(
-                handle_name, attr, callback
-            )
-
-            # Assert that Read/Write command was used to get the handle by name
-            self.assert_command_id(requests[0], constants.ADSCOMMAND_READWRITE)
-            # Assert that ADDDEVICENOTIFICATION was used to add device notification
-            self.assert_command_id(requests[1], constants.ADSCOMMAND_ADDDEVICENOTE)
 
-            self.plc.del_device_notification(notification, user)
+        notification, user = self.plc.add_device_notification(
+            handle_name, attr, callback
+        )
+        self.plc.del_device_notification(notification, user)
 
-        # Assert that ADDDEVICENOTIFICATION was used to add device notification
-        self.assert_command_id(requests[2], constants.ADSCOMMAND_DELDEVICENOTE)
+        self.expect_requests(
+            constants.ADSCOMMAND_READWRITE,  # get handle by name
+            constants.ADSCOMMAND_ADDDEVICENOTE,
+            constants.ADSCOMMAND_DELDEVICENOTE,
+            constants.ADSCOMMAND_WRITE,  # release handle
+        )
 
     def test_device_notification_by_name(self):
         def callback(notification, data):
             pass
 
-        handle_name = "TestHandle"
-        attr = NotificationAttrib(length=4)
-        requests = self.test_server.request_history
+        handle_name = TEST_HANDLE_NAME
+        attr = NOTIFICATION_ATTR4
 
-        with self.plc:
-            notification, user = self.plc.add_device_notification(
-                handle_name, attr, callback
-            )
-            # Assert that Read/Write command was used to get the handle by name
-            self.assert_command_id(requests[0], constants.ADSCOMMAND_READWRITE)
-            # Assert that ADDDEVICENOTIFICATION was used to add device notification
-            self.assert_command_id(requests[1], constants.ADSCOMMAND_ADDDEVICENOTE)
-
-            self.plc.del_device_notification(notification, user)
+        notification, user = self.plc.add_device_notification(
+            handle_name, attr, callback
+        )
+        self.plc.del_device_notification(notification, user)
 
-        # Assert that ADDDEVICENOTIFICATION was used to add device notification
-        self.assert_command_id(requests[2], constants.ADSCOMMAND_DELDEVICENOTE)
+        self.expect_requests(
+            constants.ADSCOMMAND_READWRITE,  # get handle by name
+            constants.ADSCOMMAND_ADDDEVICENOTE,
+            constants.ADSCOMMAND_DELDEVICENOTE,
+            constants.ADSCOMMAND_WRITE,  # release handle
+        )
 
     def test_device_notification_by_tuple(self):
         def callback(notification, data):
@@ -790,56 +708,51 @@ class AdsConnectionClassTestCase(unittest.TestCase):
 
         n_index_group = 1
         n_index_offset = 0
-        attr = NotificationAttrib(length=4)
-        requests = self.test_server.request_history
+        attr = NOTIFICATION_ATTR4
 
-        with self.plc:
-            notification, user_hnl = self.plc.add_device_notification(
-                (n_index_group, n_index_offset), attr, callback
-            )
-
-            # Assert that ADDDEVICENOTIFICATION was used to add device notification
-            self.assert_command_id(requests[0], constants.ADSCOMMAND_ADDDEVICENOTE)
-            # Delete notification without user-handle
-            self.plc.del_device_notification(notification, None)
-
-            # Create notification with user_handle
-            notification, new_user_hnl = self.plc.add_device_notification(
-                (n_index_group, n_index_offset), attr, callback, user_handle=user_hnl
-            )
-            self.assertEqual(new_user_hnl, user_hnl)
+        notification, user_hnl = self.plc.add_device_notification(
+            (n_index_group, n_index_offset), attr, callback
+        )
+        # Delete notification without user-handle
+        self.plc.del_device_notification(notification, None)
 
-            # Assert that ADDDEVICENOTIFICATION was used to add device notification
-            self.assert_command_id(requests[1], constants.ADSCOMMAND_DELDEVICENOTE)
-            self.plc.del_device_notification(notification, None)
+        # Create notification with user_handle
+        notification, new_user_hnl = self.plc.add_device_notification(
+            (n_index_group, n_index_offset), attr, callback, user_handle=user_hnl
+        )
+        self.assertEqual(new_user_hnl, user_hnl)
+        self.plc.del_device_notification(notification, None)
+
+        self.expect_requests(
+            constants.ADSCOMMAND_ADDDEVICENOTE,
+            constants.ADSCOMMAND_DELDEVICENOTE,
+            constants.ADSCOMMAND_ADDDEVICENOTE,
+            constants.ADSCOMMAND_DELDEVICENOTE,
+        )
 
     def test_device_notification_data_error(self):
         def callback(notification, data):
             pass
 
-        attr = NotificationAttrib(length=4)
+        attr = NOTIFICATION_ATTR4
 
-        with self.plc:
-            with self.assertRaises(TypeError):
-                self.plc.add_device_notification(0, attr, callback)
+        with self.assertRaises(TypeError):
+            self.plc.add_device_notification(0, attr, callback)
 
-            with self.assertRaises(TypeError):
-                self.plc.add_device_notification(None, attr, callback)
+        with self.assertRaises(TypeError):
+            self.plc.add_device_notification(None, attr, callback)
 
     def test_decorated_device_notification(self):
 
-        plc = pyads.Connection(TEST_SERVER_AMS_NET_ID, TEST_SERVER_AMS_PORT)
-
-        @plc.notification(pyads.PLCTYPE_INT)
+        @self.plc.notification(pyads.PLCTYPE_INT)
         def callback(handle, name, timestamp, value):
-            print(handle, name, timestamp, value)
+            pass
 
-        with plc:
-            handles = plc.add_device_notification(
-                "a", pyads.NotificationAttrib(20), callback
-            )
-            plc.write_by_name("a", 1, pyads.PLCTYPE_INT)
-            plc.del_device_notification(*handles)
+        handles = self.plc.add_device_notification(
+            "a", pyads.NotificationAttrib(20), callback
+        )
+        self.plc.write_by_name("a", 1, pyads.PLCTYPE_INT)
+        self.plc.del_device_notification(*handles)
 
     def test_notification_decorator(self):
         # type: () -> None
@@ -857,7 +770,7 @@ class AdsConnectionClassTestCase(unittest.TestCase):
         notification.nTimeStamp = 132223104000000000
         notification.cbSampleSize = 1
         notification.data = 5
-        callback(pointer(notification), "TestName")
+        callback(LP_SAdsNotificationHeader(notification), "TestName")
 
     def test_notification_decorator_filetime(self):
         # type: () -> None
@@ -871,7 +784,7 @@ class AdsConnectionClassTestCase(unittest.TestCase):
         notification.nTimeStamp = 132223104000000000
         notification.cbSampleSize = 1
         notification.data = 5
-        callback(pointer(notification), "TestName")
+        callback(LP_SAdsNotificationHeader(notification), "TestName")
 
     def test_notification_decorator_string(self):
         # type: () -> None
@@ -882,7 +795,7 @@ class AdsConnectionClassTestCase(unittest.TestCase):
             self.assertEqual(value, "Hello world!")
 
         notification = create_notification_struct(b"Hello world!\x00\x00\x00\x00")
-        callback(pointer(notification), "")
+        callback(LP_SAdsNotificationHeader(notification), "")
 
     def test_notification_decorator_lreal(self):
         # type: () -> None
@@ -893,9 +806,9 @@ class AdsConnectionClassTestCase(unittest.TestCase):
             self.assertEqual(value, 1234.56789012345)
 
         notification = create_notification_struct(
-            struct.pack("<d", 1234.56789012345)
+            _F64LE.pack(1234.56789012345)
         )
-        callback(pointer(notification), "")
+        callback(LP_SAdsNotificationHeader(notification), "")
 
     def test_notification_decorator_struct(self):
         # type: () -> None
@@ -908,9 +821,9 @@ class AdsConnectionClassTestCase(unittest.TestCase):
             self.assertEqual(value.build, 3040)
 
         notification = create_notification_struct(
-            bytes(structs.SAdsVersion(version=3, revision=1, build=3040))
+            ctypes_to_bytes(structs.SAdsVersion(version=3, revision=1, build=3040))
         )
-        callback(pointer(notification), "")
+        callback(LP_SAdsNotificationHeader(notification), "")
 
     def test_notification_decorator_array(self):
         # type: () -> None
@@ -923,7 +836,7 @@ class AdsConnectionClassTestCase(unittest.TestCase):
         notification = create_notification_struct(
             b"\x00\x00\x01\x00\x02\x00\x03\x00\x04\x00"
         )
-        callback(pointer(notification), "")
+        callback(LP_SAdsNotificationHeader(notification), "")
 
     def test_notification_decorator_struct_array(self):
         # type: () -> None
@@ -939,11 +852,12 @@ class AdsConnectionClassTestCase(unittest.TestCase):
                 self.assertEqual(value[i].revision, 1)
                 self.assertEqual(value[i].build, 3040)
 
-        data = b""
-        for i in range(4):
-            data += bytes(structs.SAdsVersion(version=i, revision=1, build=3040))
-        notification = create_notification_struct(data)
-        callback(pointer(notification), "")
+        # fill one contiguous array instead of concatenating single structs
+        data = arr_type(
+            *(structs.SAdsVersion(version=i, revision=1, build=3040) for i in range(4))
+        )
+        notification = create_notification_struct(ctypes_to_bytes(data))
+        callback(LP_SAdsNotificationHeader(notification), "")
 
     def test_multiple_connect(self):
         """
@@ -952,7 +866,7 @@ class AdsConnectionClassTestCase(unittest.TestCase):
         errors.
 
         """
-        handle_name = "TestHandle"
+        handle_name = TEST_HANDLE_NAME
         value = "Test Value"
 
         with self.plc:
@@ -967,15 +881,13 @@ class AdsConnectionClassTestCase(unittest.TestCase):
     def test_get_local_address(self):
         # type: () -> None
         """Test get_local_address method."""
-        with self.plc:
-            self.plc.get_local_address()
+        self.plc.get_local_address()
 
     def test_methods_with_closed_port(self):
         # type: () -> None
         """Test pyads.Connection methods with no open port."""
-        with self.plc:
-            adr = self.plc.get_local_address()
-            self.assertIsNotNone(adr)
+        adr = self.plc.get_local_address()
+        self.assertIsNotNone(adr)
 
         plc = pyads.Connection("127.0.0.1.1.1", 851)
         self.assertIsNone(plc.get_local_address())
@@ -999,15 +911,16 @@ class AdsConnectionClassTestCase(unittest.TestCase):
     def test_set_timeout(self):
         # type: () -> None
         """Test timeout function."""
+        # leaving the context closes the port, so the timeout does not
+        # carry over to other tests
         with self.plc:
             self.assertIsNone(self.plc.set_timeout(100))
 
     def test_get_and_release_handle(self):
         # type: () -> None
         """Test get_handle and release_handle methods"""
-        handle_name = "TestHandle"
-        with self.plc:
-            handle = self.plc.get_handle(handle_name)
+        handle_name = TEST_HANDLE_NAME
+        handle = self.plc.get_handle(handle_name)
 
         # Retrieve list of received requests from server
         requests = self.test_server.request_history
@@ -1018,12 +931,10 @@ class AdsConnectionClassTestCase(unittest.TestCase):
         # Assert that Read/Write command was used to get the handle by name
         self.assert_command_id(requests[0], constants.ADSCOMMAND_READWRITE)
         # Assert that the server received the handle by name
-        received_value = requests[0].ams_header.data[16:]
-        sent_value = (handle_name + "\x00").encode("utf-8")
-        self.assertEqual(sent_value, received_value)
+        received_value = memoryview(requests[0].ams_header.data)[16:]
+        self.assertEqual(TEST_HANDLE_NAME_BYTES, received_value)
 
-        with self.plc:
-            self.plc.release_handle(handle)
+        self.plc.release_handle(handle)
 
         # Retrieve list of received requests from server
         requests = self.test_server.request_history
@@ -1038,23 +949,11 @@ class AdsConnectionClassTestCase(unittest.TestCase):
         variables = ["i1", "i2", "i3", "str_test"]
 
         # Read twice to show caching
-        with self.plc:
-            read_values = self.plc.read_list_by_name(variables)
-            read_values2 = self.plc.read_list_by_name(variables)
-
-        # Retrieve list of received requests from server
-        requests = self.test_server.request_history
+        read_values = self.plc.read_list_by_name(variables)
+        read_values2 = self.plc.read_list_by_name(variables)
 
         # Assert that the server received - 4x symbol info, 1x sum read, 1x sum read (second)
-        self.assertEqual(len(requests), 6)
-
-        # Assert that all commands are read write
-        self.assert_command_id(requests[0], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[1], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[2], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[3], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[4], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[5], constants.ADSCOMMAND_READWRITE)
+        self.expect_requests(*[constants.ADSCOMMAND_READWRITE] * 6)
 
         # Expected result
         expected_result = {
@@ -1071,27 +970,11 @@ class AdsConnectionClassTestCase(unittest.TestCase):
         # Repeat the test without cache
         variables = ["i1", "i2", "i3", "str_test"]
 
-        with self.plc:
-            read_values = self.plc.read_list_by_name(variables, cache_symbol_info=False)
-            read_values2 = self.plc.read_list_by_name(variables)
-
-        # Retrieve list of received requests from server
-        requests = self.test_server.request_history
+        read_values = self.plc.read_list_by_name(variables, cache_symbol_info=False)
+        read_values2 = self.plc.read_list_by_name(variables)
 
         # Assert that the server received - 4x symbol info, 1x sum read, 4x symbol info (as no cache), 1 x sum read
-        self.assertEqual(len(requests), 10)
-
-        # Assert that all commands are read write
-        self.assert_command_id(requests[0], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[1], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[2], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[3], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[4], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[5], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[6], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[7], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[8], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[9], constants.ADSCOMMAND_READWRITE)
+        self.expect_requests(*[constants.ADSCOMMAND_READWRITE] * 10)
 
         # Expected result
         expected_result = {
@@ -1106,22 +989,10 @@ class AdsConnectionClassTestCase(unittest.TestCase):
     def test_read_list_ads_sub_commands(self):
         variables = ["TestVar1", "TestVar2", "str_TestVar3", "TestVar4"]
 
-        with self.plc:
-            read_values = self.plc.read_list_by_name(variables, ads_sub_commands=2)
-
-        # Retrieve list of received requests from server
-        requests = self.test_server.request_history
+        read_values = self.plc.read_list_by_name(variables, ads_sub_commands=2)
 
         # Assert that the server received - 4x symbol info, 2x sum read (as sub commands split request into two reads)
-        self.assertEqual(len(requests), 6)
-
-        # Assert that all commands are read write
-        self.assert_command_id(requests[0], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[1], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[2], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[3], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[4], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[5], constants.ADSCOMMAND_READWRITE)
+        self.expect_requests(*[constants.ADSCOMMAND_READWRITE] * 6)
 
         # Expected result
         expected_result = {
@@ -1140,27 +1011,11 @@ class AdsConnectionClassTestCase(unittest.TestCase):
             "str_test": "test",
         }
 
-        with self.plc:
-            errors = self.plc.write_list_by_name(variables, cache_symbol_info=False)
-            errors2 = self.plc.write_list_by_name(variables)
-
-        # Retrieve list of received requests from server
-        requests = self.test_server.request_history
+        errors = self.plc.write_list_by_name(variables, cache_symbol_info=False)
+        errors2 = self.plc.write_list_by_name(variables)
 
         # Assert that the server received - 4x symbol info, 1x sum write, 4x symbol info (as no cache), 1x sum write
-        self.assertEqual(len(requests), 10)
-
-        # Assert that all commands are read write
-        self.assert_command_id(requests[0], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[1], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[2], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[3], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[4], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[5], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[6], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[7], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[8], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[9], constants.ADSCOMMAND_READWRITE)
+        self.expect_requests(*[constants.ADSCOMMAND_READWRITE] * 10)
 
         # Expected result
         expected_result = {
@@ -1176,9 +1031,8 @@ class AdsConnectionClassTestCase(unittest.TestCase):
         variables = ["TestStructure", "TestVar"]
         structure_defs = {"TestStructure": (("xVar", pyads.PLCTYPE_BYTE, 1),)}
 
-        with self.plc:
-            actual_result = self.plc.read_list_by_name(variables, cache_symbol_info=False,
-                                                       structure_defs=structure_defs)
+        actual_result = self.plc.read_list_by_name(variables, cache_symbol_info=False,
+                                                   structure_defs=structure_defs)
 
         requests = self.test_server.request_history
         self.assertEqual(len(requests), 3)
@@ -1201,21 +1055,10 @@ class AdsConnectionClassTestCase(unittest.TestCase):
             "str_test": "test",
         }
 
-        with self.plc:
-            errors = self.plc.write_list_by_name(variables)
-
-        # Retrieve list of received requests from server
-        requests = self.test_server.request_history
+        errors = self.plc.write_list_by_name(variables)
 
         # Assert that the server received 5 requests 4x symbol info, 1x sum write
-        self.assertEqual(len(requests), 5)
-
-        # Assert that all commands are read write
-        self.assert_command_id(requests[0], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[1], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[2], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[3], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[4], constants.ADSCOMMAND_READWRITE)
+        self.expect_requests(*[constants.ADSCOMMAND_READWRITE] * 5)
 
         # Expected result
         expected_result = {
@@ -1234,22 +1077,10 @@ class AdsConnectionClassTestCase(unittest.TestCase):
             "TestVar4": 3,
         }
 
-        with self.plc:
-            errors = self.plc.write_list_by_name(variables, ads_sub_commands=2)
-
-        # Retrieve list of received requests from server
-        requests = self.test_server.request_history
+        errors = self.plc.write_list_by_name(variables, ads_sub_commands=2)
 
         # Assert that the server received 6 requests - 4x symbol info, 2x write as split by subcommands
-        self.assertEqual(len(requests), 6)
-
-        # Assert that all commands are read write
-        self.assert_command_id(requests[0], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[1], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[2], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[3], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[4], constants.ADSCOMMAND_READWRITE)
-        self.assert_command_id(requests[5], constants.ADSCOMMAND_READWRITE)
+        self.expect_requests(*[constants.ADSCOMMAND_READWRITE] * 6)
 
         # Expected result
         expected_result = {
@@ -1265,24 +1096,15 @@ class AdsConnectionClassTestCase(unittest.TestCase):
         symbol_type = "UINT8"
         comment = "Test Comment"
 
-        t_byte_buffer = ctypes.c_ubyte * 768
-        Buf = t_byte_buffer()
-
-        struct.pack_into(
-            str(len(symbol_name)) + "s", Buf, 0, symbol_name.encode("utf-8")
-        )
-        struct.pack_into(
-            str(len(symbol_type)) + "s",
-            Buf,
-            len(symbol_name) + 1,
-            symbol_type.encode("utf-8"),
-        )
-        struct.pack_into(
-            str(len(comment)) + "s",
-            Buf,
-            len(symbol_name) + len(symbol_type) + 2,
-            comment.encode("utf-8"),
+        # name, type and comment are stored null-terminated one after another
+        string_buffer = (
+            symbol_name.encode("utf-8") + b"\x00"
+            + symbol_type.encode("utf-8") + b"\x00"
+            + comment.encode("utf-8")
         )
+        buf = bytearray(768)
+        buf[:len(string_buffer)] = string_buffer
+        Buf = (ctypes.c_ubyte * 768).from_buffer(buf)
 
         test_struct = structs.SAdsSymbolEntry(
             0, 0, 0, 0, 0, 0, len(symbol_name), len(symbol_type), len(comment), Buf
@@ -1296,35 +1118,33 @@ class AdsConnectionClassTestCase(unittest.TestCase):
 class AdsApiTestCaseAdvanced(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        # Start dummy ADS Endpoint
+        # Use the shared testserver as dummy ADS Endpoint
         cls.handler = AdvancedHandler()
-        cls.test_server = AdsTestServer(handler=cls.handler, logging=False)
-        cls.test_server.start()
-
-        # wait a bit otherwise error might occur
-        time.sleep(1)
+        cls.test_server = test_server
+        cls.test_server.handler = cls.handler
+        cls.plc = pyads.Connection(
+            TEST_SERVER_AMS_NET_ID, TEST_SERVER_AMS_PORT, TEST_SERVER_IP_ADDRESS
+        )
+        cls.plc.open()
 
     @classmethod
     def tearDownClass(cls):
-        cls.test_server.stop()
-
-        # wait a bit for server to shutdown
-        time.sleep(1)
+        cls.plc.close()
 
     def setUp(self):
         # Clear request history before each test
-        self.test_server.request_history = []
+        self.test_server.request_history.clear()
         self.test_server.handler.reset()
 
-        self.plc = pyads.Connection(
-            TEST_SERVER_AMS_NET_ID, TEST_SERVER_AMS_PORT, TEST_SERVER_IP_ADDRESS
-        )
+        # reopen if the previous test closed the connection
+        self.plc.open()
+        # The handler forgets all symbols, so drop the cached symbol info
+        self.plc._symbol_info_cache.clear()
 
     def assert_command_id(self, request: AmsPacket, target_id: int) -> None:
         """Assert command_id and target_id."""
         # Check the request code received by the server
-        command_id = request.ams_header.command_id
-        command_id = struct.unpack("<H", command_id)[0]
+        command_id = int.from_bytes(request.ams_header.command_id, "little")
         self.assertEqual(command_id, target_id)
 
     def test_read_check_length(self):
@@ -1333,67 +1153,62 @@ class AdsApiTestCaseAdvanced(unittest.TestCase):
             PLCVariable("i", 1, constants.ADST_UINT8, symbol_type="USINT",
                         index_group=constants.INDEXGROUP_DATA,
                         index_offset=1))
-        with self.plc:
-            with self.assertRaises(RuntimeError):
-                # Since the length is checked, this must give an error
-                self.plc.read(
-                    index_group=constants.INDEXGROUP_DATA,
-                    index_offset=1,
-                    plc_datatype=constants.PLCTYPE_UINT,
-                    check_length=True,
-                )
-
-            # If the length is not checked, no error should be raised
-            value = self.plc.read(
+        with self.assertRaises(RuntimeError):
+            # Since the length is checked, this must give an error
+            self.plc.read(
                 index_group=constants.INDEXGROUP_DATA,
                 index_offset=1,
                 plc_datatype=constants.PLCTYPE_UINT,
-                check_length=False,
+                check_length=True,
             )
-            self.assertEqual(value, 1)
+
+        # If the length is not checked, no error should be raised
+        value = self.plc.read(
+            index_group=constants.INDEXGROUP_DATA,
+            index_offset=1,
+            plc_datatype=constants.PLCTYPE_UINT,
+            check_length=False,
+        )
+        self.assertEqual(value, 1)
 
     def test_get_all_symbols_empty(self):
-        with self.plc:
-            self.assertEqual(len(self.plc.get_all_symbols()), 0)
+        self.assertEqual(len(self.plc.get_all_symbols()), 0)
 
     def test_get_all_symbols_single(self):
         self.handler.add_variable(
             PLCVariable("i", 1, constants.ADST_INT16, symbol_type="INT", index_group=123, index_offset=0))
-        with self.plc:
-            symbols = self.plc.get_all_symbols()
-            self.assertEqual(len(symbols), 1)
-            self.assertEqual(symbols[0].index_group, 123)
+        symbols = self.plc.get_all_symbols()
+        self.assertEqual(len(symbols), 1)
+        self.assertEqual(symbols[0].index_group, 123)
 
     def test_read_by_name_without_datatype(self) -> None:
         """Test read by name without passing the datatype."""
         # create variable on testserver
         self.handler.add_variable(PLCVariable("test_var", 42, constants.ADST_INT16, "INT"))
-        with self.plc:
-            # read twice to show caching
-            read_value = self.plc.read_by_name("test_var")
-            read_value2 = self.plc.read_by_name("test_var")
-            self.assertEqual(read_value, 42)
-            self.assertEqual(read_value2, 42)
+        # read twice to show caching
+        read_value = self.plc.read_by_name("test_var")
+        read_value2 = self.plc.read_by_name("test_var")
+        self.assertEqual(read_value, 42)
+        self.assertEqual(read_value2, 42)
 
-            # read without caching
-            read_value = self.plc.read_by_name("test_var", cache_symbol_info=False)
-            self.assertEqual(read_value, 42)
+        # read without caching
+        read_value = self.plc.read_by_name("test_var", cache_symbol_info=False)
+        self.assertEqual(read_value, 42)
 
     def test_write_by_name_without_datatype(self) -> None:
         """Test read by name without passing the datatype."""
         # create variable on testserver
         self.handler.add_variable(PLCVariable("test_var", 0, constants.ADST_INT16, "INT"))
-        with self.plc:
-            # write twice to show caching
-            self.plc.write_by_name("test_var", 42)
-            self.plc.write_by_name("test_var", 42)
-            read_value = self.plc.read_by_name("test_var")
-            self.assertEqual(read_value, 42)
+        # write twice to show caching
+        self.plc.write_by_name("test_var", 42)
+        self.plc.write_by_name("test_var", 42)
+        read_value = self.plc.read_by_name("test_var")
+        self.assertEqual(read_value, 42)
 
-            # write without caching
-            self.plc.write_by_name("test_var", 43, cache_symbol_info=False)
-            read_value = self.plc.read_by_name("test_var")
-            self.assertEqual(read_value, 43)
+        # write without caching
+        self.plc.write_by_name("test_var", 43, cache_symbol_info=False)
+        read_value = self.plc.read_by_name("test_var")
+        self.assertEqual(read_value, 43)
 
     def test_write_list_by_name_with_structure(self):
         """Test write_list_by_name with structure definition"""
@@ -1407,8 +1222,7 @@ class AdsApiTestCaseAdvanced(unittest.TestCase):
             "TestVar": 22,
         }
 
-        with self.plc:
-            errors = self.plc.write_list_by_name(data, cache_symbol_info=False, structure_defs=structure_defs)
+        errors = self.plc.write_list_by_name(data, cache_symbol_info=False, structure_defs=structure_defs)
 
         requests = self.test_server.request_history
         self.assertEqual(len(requests), 3)
@@ -1419,28 +1233,24 @@ class AdsApiTestCaseAdvanced(unittest.TestCase):
 
         self.assertEqual(errors, {v: "no error" for v in variables})
 
-        with self.plc:
-            written_data = self.plc.read_list_by_name(variables, cache_symbol_info=False,
-                                                      structure_defs=structure_defs)
+        written_data = self.plc.read_list_by_name(variables, cache_symbol_info=False,
+                                                  structure_defs=structure_defs)
         self.assertEqual(data, written_data)
 
     def test_read_device_info(self):
         """Test read_device_info for AdvancedHandler."""
-        with self.plc:
-            name, version = self.plc.read_device_info()
-            self.assertEqual(name, "TestServer")
-            self.assertEqual(version.build, 3)
+        name, version = self.plc.read_device_info()
+        self.assertEqual(name, "TestServer")
+        self.assertEqual(version.build, 3)
 
     def test_read_state(self):
         """Test read_state for AdvancedHandler."""
-        with self.plc:
-            state = self.plc.read_state()
-            self.assertEqual(state[0], constants.ADSSTATE_RUN)
+        state = self.plc.read_state()
+        self.assertEqual(state[0], constants.ADSSTATE_RUN)
 
     def test_write_control(self):
         """Test write_control for AdvancedHandler."""
-        with self.plc:
-            self.plc.write_control(constants.ADSSTATE_IDLE, 0, 0, constants.PLCTYPE_INT)
+        self.plc.write_control(constants.ADSSTATE_IDLE, 0, 0, constants.PLCTYPE_INT)
 
     def test_read_wstring(self):
         """Test for proper WSTRING handling"""
@@ -1455,25 +1265,24 @@ class AdsApiTestCaseAdvanced(unittest.TestCase):
         )
         self.handler.add_variable(var)
 
-        with self.plc:
-            # simple read by name
-            self.assertEqual(self.plc.read_by_name("wstr"), expected1)
-            # read list by name
-            self.assertEqual(self.plc.read_list_by_name(["wstr"])["wstr"], expected1)
-            # write by name
-            self.plc.write_by_name("wstr", expected2)
-            self.assertEqual(self.plc.read_by_name("wstr"), expected2)
-            # write list by name
-            self.plc.write_list_by_name({"wstr": expected1})
-            self.assertEqual(self.plc.read_by_name("wstr"), expected1)
-
-            # read/write
-            self.assertEqual(
-                self.plc.read_write(
-                    var.index_group, var.index_offset, pyads.PLCTYPE_WSTRING, expected2, pyads.PLCTYPE_WSTRING
-                ), expected1
-            )
-            self.assertEqual(self.plc.read_by_name("wstr"), expected2)
+        # simple read by name
+        self.assertEqual(self.plc.read_by_name("wstr"), expected1)
+        # read list by name
+        self.assertEqual(self.plc.read_list_by_name(["wstr"])["wstr"], expected1)
+        # write by name
+        self.plc.write_by_name("wstr", expected2)
+        self.assertEqual(self.plc.read_by_name("wstr"), expected2)
+        # write list by name
+        self.plc.write_list_by_name({"wstr": expected1})
+        self.assertEqual(self.plc.read_by_name("wstr"), expected1)
+
+        # read/write
+        self.assertEqual(
+            self.plc.read_write(
+                var.index_group, var.index_offset, pyads.PLCTYPE_WSTRING, expected2, pyads.PLCTYPE_WSTRING
+            ), expected1
+        )
+        self.assertEqual(self.plc.read_by_name("wstr"), expected2)
 
     def test_wstring_struct(self):
         wstring_structure_def = (
@@ -1496,49 +1305,43 @@ class AdsApiTestCaseAdvanced(unittest.TestCase):
             ("value", 24),
         ])
 
-        # build structure value
-        data = "hällo world".encode("utf-16-le") + 2 * b"\x00"
-        byte_list = list(data) + (2 * (PLC_DEFAULT_STRING_SIZE + 1) - len(data)) * [0]
-        byte_list += [10, 0]
+        # build structure value, WSTRINGs are zero-padded to their full size
+        wstring_size = 2 * (PLC_DEFAULT_STRING_SIZE + 1)
+        hello_world = "hällo world".encode("utf-16-le").ljust(wstring_size, b"\x00")
+        foo_bar = "foo bar".encode("utf-16-le").ljust(wstring_size, b"\x00")
         wstring_var = PLCVariable(
             "wstring_struct",
-            value=bytes(byte_list),
+            value=hello_world + b"\x0a\x00",
             ads_type=None,
             symbol_type="S_WSTRING"
         )
         self.handler.add_variable(wstring_var)
 
-        data = "hällo world".encode("utf-16-le") + 2 * b"\x00"
-        byte_list = list(data) + (2 * (PLC_DEFAULT_STRING_SIZE + 1) - len(data)) * [0]
-        data = "foo bar".encode("utf-16-le") + 2 * b"\x00"
-        byte_list += list(data) + (2 * (PLC_DEFAULT_STRING_SIZE + 1) - len(data)) * [0]
-        byte_list += [10, 0]
         wstring_array_var = PLCVariable(
             "wstring_array_struct",
-            value=bytes(byte_list),
+            value=hello_world + foo_bar + b"\x0a\x00",
             ads_type=None,
             symbol_type="S_WSTRING_ARRAY"
         )
         self.handler.add_variable(wstring_array_var)
 
-        with self.plc:
-            # read WSTRING struct
-            val = self.plc.read_structure_by_name("wstring_struct", wstring_structure_def)
-            self.assertEqual({"name": "hällo world", "value": 10}, val)
-
-            # write WSTRING struct
-            self.plc.write_structure_by_name("wstring_struct", wstring_values, wstring_structure_def)
-            val = self.plc.read_structure_by_name("wstring_struct", wstring_structure_def)
-            self.assertEqual(wstring_values, val)
-
-            # read struct with WSTRING array
-            val = self.plc.read_structure_by_name("wstring_array_struct", wstring_array_structure_def)
-            self.assertEqual({"name": ["hällo world", "foo bar"], "value": 10}, val)
-
-            # write struct with WSTRING array
-            self.plc.write_structure_by_name("wstring_array_struct", wstring_array_values, wstring_array_structure_def)
-            val = self.plc.read_structure_by_name("wstring_array_struct", wstring_array_structure_def)
-            self.assertEqual(wstring_array_values, val)
+        # read WSTRING struct
+        val = self.plc.read_structure_by_name("wstring_struct", wstring_structure_def)
+        self.assertEqual({"name": "hällo world", "value": 10}, val)
+
+        # write WSTRING struct
+        self.plc.write_structure_by_name("wstring_struct", wstring_values, wstring_structure_def)
+        val = self.plc.read_structure_by_name("wstring_struct", wstring_structure_def)
+        self.assertEqual(wstring_values, val)
+
+        # read struct with WSTRING array
+        val = self.plc.read_structure_by_name("wstring_array_struct", wstring_array_structure_def)
+        self.assertEqual({"name": ["hällo world", "foo bar"], "value": 10}, val)
+
+        # write struct with WSTRING array
+        self.plc.write_structure_by_name("wstring_array_struct", wstring_array_values, wstring_array_structure_def)
+        val = self.plc.read_structure_by_name("wstring_array_struct", wstring_array_structure_def)
+        self.assertEqual(wstring_array_values, val)
 
 
 if __name__ == "__main__":
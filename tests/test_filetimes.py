@@ -9,7 +9,7 @@
 """
 import unittest
 from datetime import datetime, timedelta
-from pyads.filetimes import UTC, dt_to_filetime, filetime_to_dt
+from pyads.filetimes import UTC, EPOCH_AS_FILETIME, dt_to_filetime, filetime_to_dt
 
 
 class FiletimesTestCase(unittest.TestCase):
@@ -34,13 +34,34 @@ class FiletimesTestCase(unittest.TestCase):
 
     def test_filetime_dt_conversion(self):
 
-        dt_now = datetime(2017, 10, 13, 10, 11, 12)
+        dts = (
+            datetime(2017, 10, 13, 10, 11, 12),
+            datetime(1970, 1, 1),
+            datetime(2009, 7, 25, 23, 0),
+        )
 
-        ft = dt_to_filetime(dt_now)
-        dt = filetime_to_dt(ft)
+        for dt_in in dts:
+            with self.subTest(dt=dt_in):
+                ft = dt_to_filetime(dt_in)
+                dt = filetime_to_dt(ft)
 
-        # should be identical
-        self.assertEqual(dt_now, dt)
+                # should be identical
+                self.assertEqual(dt_in, dt)
+
+    def test_dt_to_filetime(self):
+
+        ft = 128930364000000000  # datetime(2009, 7, 25, 23, 0)
+
+        # fractions of a second are dropped
+        self.assertEqual(ft, dt_to_filetime(datetime(2009, 7, 25, 23, 0, 0, 999999)))
+
+        # time zone-aware datetimes are converted like naive ones
+        self.assertEqual(ft, dt_to_filetime(datetime(2009, 7, 25, 23, 0, tzinfo=UTC())))
+
+        # dates before the epoch
+        self.assertEqual(
+            EPOCH_AS_FILETIME - 1 * 10 ** 7, dt_to_filetime(datetime(1969, 12, 31, 23, 59, 59))
+        )
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
-import time
+import queue
+import select
 import unittest
 import threading
 import socket
@@ -8,6 +9,13 @@ from pyads import add_route_to_plc
 from pyads.constants import PORT_REMOTE_UDP
 from pyads.utils import platform_is_linux
 
+# Precompiled formats of the route packet fields
+_U16LE = struct.Struct("<H")
+_AMS_ID = struct.Struct(">6B")
+
+# Time in seconds a test waits for the receiver to hand over the request
+RECEIVE_TIMEOUT = 5.0
+
 
 class PLCRouteTestCase(unittest.TestCase):
 
@@ -19,147 +27,162 @@ class PLCRouteTestCase(unittest.TestCase):
     ADDING_AMS_ID = "5.6.7.8.1.1"
     HOSTNAME = "Host"
     PLC_AMS_ID = "11.22.33.44.1.1"
-
-    def setUp(self):
-        pass
-
-    def tearDown(self):
-        pass
-
-    def plc_route_receiver(self):
-        with closing(socket.socket(socket.AF_INET, socket.SOCK_DGRAM)) as sock:
-            sock.bind(("", PORT_REMOTE_UDP))
-
-            # Keep looping until we get an add address packet
-            addr = [0]
-            while addr[0] != self.PLC_IP:
-                data, addr = sock.recvfrom(1024)
-
-            # Decipher data and 'add route'
-            data = data[12:]  # Remove our data header
-
-            sending_ams_bytes = data[:6]  # Sending AMS address
-            sending_ams = ".".join(map(str, struct.unpack(">6B", sending_ams_bytes)))
-            data = data[6:]
-
-            comm_port = struct.unpack("<H", data[:2])[
-                0
-            ]  # Internal communication port (PORT_SYSTEMSERVICE)
-            data = data[2:]
-
-            command_code = struct.unpack("<H", data[:2])[
-                0
-            ]  # Comand code to write to PLC
-            data = data[2:]
-
-            data = data[4:]  # Remove protocol bytes
-
-            len_route_name = struct.unpack("<H", data[:2])[0]  # Length of route name
-            data = data[2:]
-
-            route_name = data[:len_route_name].decode(
-                "utf-8"
-            )  # Null terminated username
-            data = data[len_route_name:]
-
-            data = data[2:]  # Remove protocol bytes
-
-            len_ams_id = struct.unpack("<H", data[:2])[0]  # Length of adding AMS ID
-            data = data[2:]
-
-            adding_ams_id_bytes = data[:len_ams_id]  # AMS ID being added to PLC
-            adding_ams_id = ".".join(
-                map(str, struct.unpack(">6B", adding_ams_id_bytes))
-            )
-            data = data[len_ams_id:]
-
-            data = data[2:]  # Remove protocol bytes
-
-            len_username = struct.unpack("<H", data[:2])[0]  # Length of PLC username
-            data = data[2:]
-
-            username = data[:len_username].decode("utf-8")  # Null terminated username
-            data = data[len_username:]
-
-            data = data[2:]  # Remove protocol bytes
-
-            len_password = struct.unpack("<H", data[:2])[0]  # Length of PLC password
-            data = data[2:]
-
-            password = data[:len_password].decode("utf-8")  # Null terminated username
-            data = data[len_password:]
-
-            data = data[2:]  # Remove protocol bytes
-
-            len_sending_host = struct.unpack("<H", data[:2])[0]  # Length of host name
-            data = data[2:]
-
-            hostname = data[:len_sending_host].decode(
-                "utf-8"
-            )  # Null terminated hostname
-            data = data[len_sending_host:]
-
-            self.assertEqual(len(data), 0)  # We should have popped everything from data
-            self.assertEqual(sending_ams, self.SENDER_AMS)
-            self.assertEqual(comm_port, 10000)
-            self.assertEqual(command_code, 5)
-            self.assertEqual(
-                len_sending_host, len(self.HOSTNAME) + 1
-            )  # +1 for the null terminator
-            self.assertEqual(hostname, self.HOSTNAME + "\0")
-            self.assertEqual(adding_ams_id, self.ADDING_AMS_ID)
-            self.assertEqual(
-                len_username, len(self.USERNAME) + 1
-            )  # +1 for the null terminator
-            self.assertEqual(username, self.USERNAME + "\0")
-
-            # Don't check the password since that's part the correct/incorrect response test
-            # We can also assume that if the data after the password is correct, then the password was sent/read correctly
-            # self.assertEqual(len_password, len(self.PASSWORD) + 1)				# +1 for the null terminator
-            # self.assertEqual(password, self.PASSWORD + '\0')
-
-            self.assertEqual(
-                len_route_name, len(self.ROUTE_NAME) + 1
-            )  # +1 for the null terminator
-            self.assertEqual(route_name, self.ROUTE_NAME + "\0")
-
-            if password == self.PASSWORD + "\0":
-                password_correct = True
-            else:
-                password_correct = False
+    PLC_AMS_ID_BYTES = bytes(map(int, PLC_AMS_ID.split(".")))
+
+    @classmethod
+    def setUpClass(cls):
+        # type: () -> None
+        """Start one receiver that answers the route requests of all tests."""
+        cls.requests = queue.Queue()
+        cls.receiver_stop = threading.Event()
+        cls.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        cls.sock.bind(("", PORT_REMOTE_UDP))
+
+        cls.route_thread = threading.Thread(target=cls.plc_route_receiver)
+        cls.route_thread.daemon = True
+        cls.route_thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        # type: () -> None
+        """Stop the receiver and release the UDP port."""
+        cls.receiver_stop.set()
+        cls.route_thread.join()
+        cls.sock.close()
+
+    @classmethod
+    def plc_route_receiver(cls):
+        # type: () -> None
+        """Answer add route requests until the test case is torn down.
+
+        Every parsed request is handed over to the running test via the
+        `requests` queue, so the assertions are made in the test itself.
+
+        """
+        while not cls.receiver_stop.is_set():
+            ready, _, _ = select.select([cls.sock], [], [], 0.1)
+            if not ready:
+                continue
+
+            # Only handle add address packets
+            data, addr = cls.sock.recvfrom(1024)
+            if addr[0] != cls.PLC_IP:
+                continue
+
+            request = cls.parse_route_request(data)
+            cls.requests.put(request)
 
             # Build response
-            response = struct.pack(
-                ">12s", b"\x03\x66\x14\x71\x00\x00\x00\x00\x06\x00\x00\x80"
-            )  # Same header as being sent to the PLC, but with 80 at the end
-            response += struct.pack(
-                ">6B", *map(int, self.PLC_AMS_ID.split("."))
-            )  # PLC AMS id
-            response += struct.pack(
-                "<H", 10000
-            )  # Internal communication port (PORT_SYSTEMSERVICE)
-            response += struct.pack(">2s", b"\x01\x00")  # Command code read
-            response += struct.pack(
-                ">4s", b"\x00\x00\x01\x04"
-            )  # Block of unknown protocol
-            if password_correct:
-                response += struct.pack(">3s", b"\x04\x00\x00")  # Password Correct
+            response = (
+                # Same header as being sent to the PLC, but with 80 at the end
+                b"\x03\x66\x14\x71\x00\x00\x00\x00\x06\x00\x00\x80"
+                + cls.PLC_AMS_ID_BYTES  # PLC AMS id
+                + b"\x10\x27"  # Internal communication port (PORT_SYSTEMSERVICE)
+                + b"\x01\x00"  # Command code read
+                + b"\x00\x00\x01\x04"  # Block of unknown protocol
+            )
+            if request["password"] == cls.PASSWORD + "\0":
+                response += b"\x04\x00\x00"  # Password Correct
             else:
-                response += struct.pack(">3s", b"\x00\x04\x07")  # Password Incorrect
-            response += struct.pack(">2s", b"\x00\x00")  # Block of unknown protocol
+                response += b"\x00\x04\x07"  # Password Incorrect
+            response += b"\x00\x00"  # Block of unknown protocol
 
             # Send our response back to sender
-            sock.sendto(response, addr)
+            cls.sock.sendto(response, addr)
+
+    @staticmethod
+    def parse_route_request(data):
+        # type: (bytes) -> dict
+        """Decipher an add route request, reading the fields in place."""
+        view = memoryview(data)
+        offset = 12  # Skip our data header
+
+        def read_u16():
+            # type: () -> int
+            nonlocal offset
+            value = _U16LE.unpack_from(view, offset)[0]
+            offset += 2
+            return value
+
+        def read_bytes(length):
+            # type: (int) -> bytes
+            nonlocal offset
+            value = view[offset:offset + length].tobytes()
+            offset += length
+            return value
+
+        request = {}
+
+        # Sending AMS address
+        request["sending_ams"] = ".".join(map(str, _AMS_ID.unpack(read_bytes(6))))
+
+        # Internal communication port (PORT_SYSTEMSERVICE)
+        request["comm_port"] = read_u16()
+        request["command_code"] = read_u16()  # Comand code to write to PLC
+
+        offset += 4  # Skip protocol bytes
+
+        request["len_route_name"] = read_u16()  # Length of route name
+        # Null terminated route name
+        request["route_name"] = read_bytes(request["len_route_name"]).decode("utf-8")
+
+        offset += 2  # Skip protocol bytes
+
+        len_ams_id = read_u16()  # Length of adding AMS ID
+        # AMS ID being added to PLC
+        request["adding_ams_id"] = ".".join(
+            map(str, _AMS_ID.unpack(read_bytes(len_ams_id)))
+        )
+
+        offset += 2  # Skip protocol bytes
+
+        request["len_username"] = read_u16()  # Length of PLC username
+        # Null terminated username
+        request["username"] = read_bytes(request["len_username"]).decode("utf-8")
+
+        offset += 2  # Skip protocol bytes
+
+        len_password = read_u16()  # Length of PLC password
+        # Null terminated password
+        request["password"] = read_bytes(len_password).decode("utf-8")
+
+        offset += 2  # Skip protocol bytes
+
+        request["len_sending_host"] = read_u16()  # Length of host name
+        # Null terminated hostname
+        request["hostname"] = read_bytes(request["len_sending_host"]).decode("utf-8")
+
+        # We should have read everything from data
+        request["unread"] = len(data) - offset
+        return request
+
+    def assert_route_request(self, request):
+        # type: (dict) -> None
+        """Check the fields of a received add route request."""
+        self.assertEqual(request["unread"], 0)
+        self.assertEqual(request["sending_ams"], self.SENDER_AMS)
+        self.assertEqual(request["comm_port"], 10000)
+        self.assertEqual(request["command_code"], 5)
+        self.assertEqual(
+            request["len_sending_host"], len(self.HOSTNAME) + 1
+        )  # +1 for the null terminator
+        self.assertEqual(request["hostname"], self.HOSTNAME + "\0")
+        self.assertEqual(request["adding_ams_id"], self.ADDING_AMS_ID)
+        self.assertEqual(
+            request["len_username"], len(self.USERNAME) + 1
+        )  # +1 for the null terminator
+        self.assertEqual(request["username"], self.USERNAME + "\0")
+
+        # Don't check the password since that's part the correct/incorrect response test
+        # We can also assume that if the data after the password is correct, then the password was sent/read correctly
+
+        self.assertEqual(
+            request["len_route_name"], len(self.ROUTE_NAME) + 1
+        )  # +1 for the null terminator
+        self.assertEqual(request["route_name"], self.ROUTE_NAME + "\0")
 
     def test_correct_route(self):
         if platform_is_linux():
-            # Start receiving listener
-            route_thread = threading.Thread(target=self.plc_route_receiver)
-            route_thread.setDaemon(True)
-            route_thread.start()
-
-            time.sleep(1)
-
             # Try to set up a route with ourselves using all the optionals
             try:
                 result = add_route_to_plc(
@@ -174,15 +197,11 @@ class PLCRouteTestCase(unittest.TestCase):
             except:
                 result = None
 
+            self.assert_route_request(self.requests.get(timeout=RECEIVE_TIMEOUT))
             self.assertTrue(result)
 
     def test_incorrect_route(self):
         if platform_is_linux():
-            # Start receiving listener
-            route_thread = threading.Thread(target=self.plc_route_receiver)
-            route_thread.setDaemon(True)
-            route_thread.start()
-
             # Try to set up a route with ourselves using all the optionals AND an incorrect password
             try:
                 result = add_route_to_plc(
@@ -197,6 +216,7 @@ class PLCRouteTestCase(unittest.TestCase):
             except:
                 result = None
 
+            self.assert_route_request(self.requests.get(timeout=RECEIVE_TIMEOUT))
             self.assertFalse(result)
 
 
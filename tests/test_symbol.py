@@ -6,24 +6,81 @@
 :created on: 2020-11-16
 
 """
-import time
 from datetime import datetime, timedelta
 import struct
-from ctypes import sizeof, pointer
+from ctypes import sizeof
 import unittest
+from typing import Optional
 from unittest import mock
 
 import pyads
 from pyads.testserver import AdsTestServer, AdvancedHandler, PLCVariable
 from pyads import constants, AdsSymbol, bytes_from_dict
 
-from tests.test_connection_class import create_notification_struct
-
 # These are pretty arbitrary
 TEST_SERVER_AMS_NET_ID = "127.0.0.1.1.1"
 TEST_SERVER_IP_ADDRESS = "127.0.0.1"
 TEST_SERVER_AMS_PORT = pyads.PORT_SPS1
 
+# Initial values of the array variables, packed once at import
+ARR5_INT_BYTES = struct.pack("<5h", *range(5))
+ARR21_INT8_BYTES = struct.pack("<21b", *range(21))
+
+# Structure variables and their initial values, packed once at import
+STRUCTURE_DEF = (
+    ("i", pyads.PLCTYPE_INT, 1),
+    ("s", pyads.PLCTYPE_STRING, 1),
+)
+STRUCTURE_VALUES = {"i": 1, "s": "foo"}
+STRUCTURE_BYTES = bytes(bytes_from_dict(STRUCTURE_VALUES, STRUCTURE_DEF))
+
+STRUCTURE_ARRAY_DEF = (
+    ("a", pyads.PLCTYPE_INT, 1),
+    ("b", pyads.PLCTYPE_INT, 1),
+    ("s", pyads.PLCTYPE_STRING, 1)
+)
+STRUCTURE_ARRAY_VALUES = [{"a": 1, "b": 2, "s": "foo"}, {"a": 3, "b": 4, "s": "bar"}]
+STRUCTURE_ARRAY_BYTES = bytes(
+    bytes_from_dict(STRUCTURE_ARRAY_VALUES, STRUCTURE_ARRAY_DEF)
+)
+
+# Initial value of the default LREAL variable
+TEST_DOUBLE_BYTES = bytes(8)
+
+# PLCTYPE_ARR_* functions and the size of a single array item in bytes
+ARRAY_TYPE_SIZES = (
+    (constants.PLCTYPE_ARR_REAL, 4),
+    (constants.PLCTYPE_ARR_LREAL, 8),
+    (constants.PLCTYPE_ARR_BOOL, 1),
+    (constants.PLCTYPE_ARR_INT, 2),
+    (constants.PLCTYPE_ARR_UINT, 2),
+    (constants.PLCTYPE_ARR_SHORT, 2),
+    (constants.PLCTYPE_ARR_USHORT, 2),
+    (constants.PLCTYPE_ARR_DINT, 4),
+    (constants.PLCTYPE_ARR_UDINT, 4),
+    (constants.PLCTYPE_ARR_USINT, 1),
+)
+
+handler = None  # type: Optional[AdvancedHandler]
+test_server = None  # type: Optional[AdsTestServer]
+
+
+def setUpModule():
+    # type: () -> None
+    """Setup the ADS test server shared by all testcases of this module."""
+    global handler, test_server
+    handler = AdvancedHandler()
+    test_server = AdsTestServer(handler=handler, logging=False)
+    test_server.start()
+    if not test_server.wait_until_ready(timeout=1):
+        raise RuntimeError("Testserver does not accept connections")
+
+
+def tearDownModule():
+    # type: () -> None
+    """Tear down the test server."""
+    test_server.stop()
+
 
 class AdsSymbolTestCase(unittest.TestCase):
     """Testcase for ADS symbol class"""
@@ -31,43 +88,43 @@ class AdsSymbolTestCase(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         # type: () -> None
-        """Setup the ADS test server."""
-        cls.handler = AdvancedHandler()
-        cls.test_server = AdsTestServer(handler=cls.handler, logging=False)
-        cls.test_server.start()
+        """Use the shared test server with the advanced handler."""
+        cls.handler = handler
+        cls.test_server = test_server
 
-        # wait a bit otherwise error might occur
-        time.sleep(1)
+        # All tests share one connection to the test server
+        cls.plc = pyads.Connection(
+            TEST_SERVER_AMS_NET_ID, TEST_SERVER_AMS_PORT, TEST_SERVER_IP_ADDRESS
+        )
+        cls.plc.open()
 
     @classmethod
     def tearDownClass(cls):
         # type: () -> None
-        """Tear down the test server."""
-        cls.test_server.stop()
-
-        # wait a bit for server to shutdown
-        time.sleep(1)
+        """Close the shared connection."""
+        cls.plc.close()
 
     def setUp(self):
         # type: () -> None
-        """Establish connection to the test server."""
+        """Reset the shared connection to the test server."""
 
         # Clear test server and handler
-        self.test_server.request_history = []
+        self.test_server.request_history.clear()
         self.handler.reset()
 
+        # Reopen if the previous test closed the connection and forget the
+        # symbol info of the variables that were just removed
+        self.plc.open()
+        self.plc._symbol_info_cache.clear()
+
         # Create PLC variable that is added by default
         self.test_var = PLCVariable(
-            "TestDouble", bytes(8), ads_type=constants.ADST_REAL64, symbol_type="LREAL"
+            "TestDouble", TEST_DOUBLE_BYTES, ads_type=constants.ADST_REAL64, symbol_type="LREAL"
         )
         self.test_var.comment = "Some variable of type double"
         self.test_var_type = pyads.constants.PLCTYPE_LREAL  # Corresponds with "LREAL"
         self.handler.add_variable(self.test_var)
 
-        self.plc = pyads.Connection(
-            TEST_SERVER_AMS_NET_ID, TEST_SERVER_AMS_PORT, TEST_SERVER_IP_ADDRESS
-        )
-
     def assertAdsRequestsCount(self, expected):
         real = len(self.test_server.request_history)
         self.assertEqual(
@@ -78,8 +135,7 @@ class AdsSymbolTestCase(unittest.TestCase):
 
     def test_init_by_name(self):
         """Test symbol creation by name"""
-        with self.plc:
-            symbol = AdsSymbol(self.plc, name=self.test_var.name)
+        symbol = AdsSymbol(self.plc, name=self.test_var.name)
 
         # Verify looked up info
         self.assertEqual(self.test_var.name, symbol.name)
@@ -97,15 +153,13 @@ class AdsSymbolTestCase(unittest.TestCase):
 
         var = PLCVariable(
             "ArrayVar",
-            struct.pack("<5h", *range(5)),
+            ARR5_INT_BYTES,
             ads_type=constants.ADST_INT16,  # dataType does not represent array unfortunately
             symbol_type="ARRAY [1..5] OF INT",  # Array looks like this in PLC
         )
         # manually
         self.handler.add_variable(var)
 
-        self.plc.open()
-
         symbol = AdsSymbol(self.plc, name=var.name)
 
         # Verify looked up info
@@ -140,14 +194,13 @@ class AdsSymbolTestCase(unittest.TestCase):
 
         var = PLCVariable(
             "ArrayVar",
-            struct.pack("<21b", *range(21)),
+            ARR21_INT8_BYTES,
             ads_type=constants.ADST_VOID,
             symbol_type="matrix_21_int8_T",  # Simulink array looks like this
             index_group = 123,
             index_offset = 100,
         )
         self.handler.add_variable(var)
-        self.plc.open()
         symbol = AdsSymbol(
             self.plc,
             name=var.name,
@@ -171,8 +224,7 @@ class AdsSymbolTestCase(unittest.TestCase):
         self.test_var.symbol_type = "SINT"
         # Variable is reference to database entry, so no saving required
 
-        with self.plc:
-            symbol = AdsSymbol(self.plc, name=self.test_var.name)
+        symbol = AdsSymbol(self.plc, name=self.test_var.name)
 
         # Verify looked up info
         self.assertEqual(self.test_var.plc_type, symbol.plc_type)
@@ -183,68 +235,61 @@ class AdsSymbolTestCase(unittest.TestCase):
 
     def test_init_invalid(self):
         """Test symbol creation with missing info"""
-        with self.plc:
-
-            with self.assertRaises(ValueError):
-                AdsSymbol(
-                    self.plc,
-                    index_group=self.test_var.index_group,
-                    index_offset=self.test_var.index_offset,
-                )
+        with self.assertRaises(ValueError):
+            AdsSymbol(
+                self.plc,
+                index_group=self.test_var.index_group,
+                index_offset=self.test_var.index_offset,
+            )
 
     def test_repr(self):
         """Test debug string"""
-        with self.plc:
-            symbol = AdsSymbol(self.plc, name=self.test_var.name)
-            text = str(symbol)
-            self.assertIn(self.test_var.name, text)
-            self.assertIn(self.test_var.symbol_type, text)  # Make sure name
-            # and type are printed
+        symbol = AdsSymbol(self.plc, name=self.test_var.name)
+        text = str(symbol)
+        self.assertIn(self.test_var.name, text)
+        self.assertIn(self.test_var.symbol_type, text)  # Make sure name
+        # and type are printed
 
     def test_type_resolve(self):
         """Test if PLCTYPE is resolved correctly"""
-        with self.plc:
-
-            symbol_const = AdsSymbol(self.plc, "NonExistentVar", 123, 0,
-                                     pyads.PLCTYPE_UDINT)
-            self.assertEqual(constants.PLCTYPE_UDINT, symbol_const.plc_type)
-            self.assertNotIsInstance(symbol_const.symbol_type, str)  # symbol_type
-            # can't a neat human-readable string now
-
-            symbol_str = AdsSymbol(self.plc, "NonExistentVar", 123, 0, "UDINT")
-            self.assertEqual(constants.PLCTYPE_UDINT, symbol_str.plc_type)
-            self.assertEqual("UDINT", symbol_str.symbol_type)
-
-            symbol_missing = AdsSymbol(
-                self.plc, "NonExistentVar", 123, 0, "INCORRECT_TYPE"
-            )
-            self.assertIsNone(symbol_missing.plc_type)
+        symbol_const = AdsSymbol(self.plc, "NonExistentVar", 123, 0,
+                                 pyads.PLCTYPE_UDINT)
+        self.assertEqual(constants.PLCTYPE_UDINT, symbol_const.plc_type)
+        self.assertNotIsInstance(symbol_const.symbol_type, str)  # symbol_type
+        # can't a neat human-readable string now
+
+        symbol_str = AdsSymbol(self.plc, "NonExistentVar", 123, 0, "UDINT")
+        self.assertEqual(constants.PLCTYPE_UDINT, symbol_str.plc_type)
+        self.assertEqual("UDINT", symbol_str.symbol_type)
+
+        symbol_missing = AdsSymbol(
+            self.plc, "NonExistentVar", 123, 0, "INCORRECT_TYPE"
+        )
+        self.assertIsNone(symbol_missing.plc_type)
 
         self.assertAdsRequestsCount(0)  # No requests
 
     def test_init_manual(self):
         """Test symbol without lookup"""
-        with self.plc:
-
-            # Create symbol while providing everything:
-            symbol = AdsSymbol(
-                self.plc,
-                name=self.test_var.name,
-                index_group=self.test_var.index_group,
-                index_offset=self.test_var.index_offset,
-                symbol_type=self.test_var_type,
-            )
+        # Create symbol while providing everything:
+        symbol = AdsSymbol(
+            self.plc,
+            name=self.test_var.name,
+            index_group=self.test_var.index_group,
+            index_offset=self.test_var.index_offset,
+            symbol_type=self.test_var_type,
+        )
 
-            self.assertAdsRequestsCount(0)  # No requests yet
+        self.assertAdsRequestsCount(0)  # No requests yet
 
-            self.plc.write(
-                self.test_var.index_group,
-                self.test_var.index_offset,
-                12.3,
-                self.test_var_type,
-            )
+        self.plc.write(
+            self.test_var.index_group,
+            self.test_var.index_offset,
+            12.3,
+            self.test_var_type,
+        )
 
-            self.assertEqual(12.3, symbol.read())
+        self.assertEqual(12.3, symbol.read())
 
         self.assertAdsRequestsCount(2)  # Only a WRITE followed by a READ
 
@@ -261,14 +306,13 @@ class AdsSymbolTestCase(unittest.TestCase):
         )
         self.handler.add_variable(var)
 
-        with self.plc:
-            # Create symbol while providing everything:
-            symbol = AdsSymbol(self.plc, name=var.name)
-            self.assertEqual(var.symbol_type, symbol.symbol_type)
-            with self.assertRaises(TypeError) as cm:
-                # Error is thrown inside pyads_ex
-                symbol.read()
-            self.assertIn("NoneType", str(cm.exception))
+        # Create symbol while providing everything:
+        symbol = AdsSymbol(self.plc, name=var.name)
+        self.assertEqual(var.symbol_type, symbol.symbol_type)
+        with self.assertRaises(TypeError) as cm:
+            # Error is thrown inside pyads_ex
+            symbol.read()
+        self.assertIn("NoneType", str(cm.exception))
         self.assertAdsRequestsCount(1)  # Only a WRITE followed by a READ
 
     def test_read_write_errors(self):
@@ -280,182 +324,129 @@ class AdsSymbolTestCase(unittest.TestCase):
 
         symbol = AdsSymbol(self.plc, "MySymbol", 123, 0, "BYTE")
 
+        self.plc.close()
         with self.assertRaises(ValueError) as cm:
             symbol.read()  # Cannot read with unopened Connection
         self.assertIn("missing or closed Connection", str(cm.exception))
 
         self.plc.open()
 
-        symbol.index_offset = None  # Set index to something invalid
-
-        # with self.assertRaises(ValueError) as cm:
-        #     symbol.read()  # Cannot read with invalid index
-        # self.assertIn('invalid values for', str(cm.exception))
-
-        with self.assertRaises(TypeError) as cm:
-            symbol.read()  # Catch error inside pyads_ex
-        self.assertIn("integer is required", str(cm.exception))
-        
-        symbol.index_group = None
-
-        with self.assertRaises(TypeError) as cm:
-            symbol.read()  # Catch error inside pyads_ex
-        self.assertIn("integer is required", str(cm.exception))
-        
-        symbol.index_offset = 'A'
+        # Set the index to something invalid
+        invalid_indices = (
+            (symbol.index_group, None),
+            (None, None),
+            (None, "A"),
+            ("B", "A"),
+        )
+        for index_group, index_offset in invalid_indices:
+            with self.subTest(index_group=index_group, index_offset=index_offset):
+                symbol.index_group = index_group
+                symbol.index_offset = index_offset
 
-        with self.assertRaises(TypeError) as cm:
-            symbol.read()  # Catch error inside pyads_ex
-        self.assertIn("integer is required", str(cm.exception))
-        
-        symbol.index_group = 'B'
-
-        with self.assertRaises(TypeError) as cm:
-            symbol.read()  # Catch error inside pyads_ex
-        self.assertIn("integer is required", str(cm.exception))        
-        
+                with self.assertRaises(TypeError) as cm:
+                    symbol.read()  # Catch error inside pyads_ex
+                self.assertIn("integer is required", str(cm.exception))
 
     def test_read(self):
         """Test symbol value reading"""
 
-        with self.plc:
-
-            self.plc.write(
-                self.test_var.index_group,
-                self.test_var.index_offset,
-                420.0,
-                self.test_var_type,
-            )
+        self.plc.write(
+            self.test_var.index_group,
+            self.test_var.index_offset,
+            420.0,
+            self.test_var_type,
+        )
 
-            symbol = AdsSymbol(self.plc, name=self.test_var.name)
+        symbol = AdsSymbol(self.plc, name=self.test_var.name)
 
-            self.assertEqual(420.0, symbol.read())
+        self.assertEqual(420.0, symbol.read())
 
         self.assertAdsRequestsCount(3)  # WRITE, READWRITE for info and
         # final read
 
     def test_read_structure(self):
         """Test symbol value reading with structures."""
-        structure_def = (
-            ("i", pyads.PLCTYPE_INT, 1),
-            ("s", pyads.PLCTYPE_STRING, 1),
-        )
-        values = {"i": 1, "s": "foo"}
-        data = bytes(bytes_from_dict(values, structure_def))
-
-        self.handler.add_variable(PLCVariable("TestStructure", data, constants.ADST_VOID, symbol_type="TestStructure"))
+        self.handler.add_variable(
+            PLCVariable("TestStructure", STRUCTURE_BYTES, constants.ADST_VOID, symbol_type="TestStructure"))
 
-        with self.plc:
-            symbol = self.plc.get_symbol("TestStructure", structure_def=structure_def)
-            read_values = symbol.read()
+        symbol = self.plc.get_symbol("TestStructure", structure_def=STRUCTURE_DEF)
+        read_values = symbol.read()
 
-        self.assertEqual(values, read_values)
+        self.assertEqual(STRUCTURE_VALUES, read_values)
 
     def test_read_structure_array(self):
         """Test symbol value reading with structures."""
-        structure_def = (
-            ("a", pyads.PLCTYPE_INT, 1),
-            ("b", pyads.PLCTYPE_INT, 1),
-            ("s", pyads.PLCTYPE_STRING, 1)
-        )
-        values = [{"a": 1, "b": 2, "s": "foo"}, {"a": 3, "b": 4, "s": "bar"}]
-        data = bytes(bytes_from_dict(values, structure_def))
-
         self.handler.add_variable(
-            PLCVariable("TestStructure", data, constants.ADST_VOID, symbol_type="TestStructure"))
+            PLCVariable("TestStructure", STRUCTURE_ARRAY_BYTES, constants.ADST_VOID, symbol_type="TestStructure"))
 
-        with self.plc:
-            symbol = self.plc.get_symbol("TestStructure", structure_def=structure_def, array_size=2)
-            read_values = symbol.read()
+        symbol = self.plc.get_symbol("TestStructure", structure_def=STRUCTURE_ARRAY_DEF, array_size=2)
+        read_values = symbol.read()
 
-        self.assertEqual(values, read_values)
+        self.assertEqual(STRUCTURE_ARRAY_VALUES, read_values)
 
     def test_write(self):
         """Test symbol value writing"""
-        with self.plc:
-
-            symbol = AdsSymbol(self.plc, name=self.test_var.name)
+        symbol = AdsSymbol(self.plc, name=self.test_var.name)
 
-            symbol.write(3.14)  # Write
+        symbol.write(3.14)  # Write
 
-            r_value = self.plc.read(
-                self.test_var.index_group,
-                self.test_var.index_offset,
-                self.test_var_type,
-            )
+        r_value = self.plc.read(
+            self.test_var.index_group,
+            self.test_var.index_offset,
+            self.test_var_type,
+        )
 
-            self.assertEqual(3.14, r_value)
+        self.assertEqual(3.14, r_value)
 
         self.assertAdsRequestsCount(3)  # READWRITE for info, WRITE and
         # test read
 
     def test_write_structure(self):
         """Test symbol writing with structures."""
-        structure_def = (
-            ("i", pyads.PLCTYPE_INT, 1),
-            ("s", pyads.PLCTYPE_STRING, 1),
-        )
-        values = {"i": 1, "s": "foo"}
-        data = bytes(bytes_from_dict(values, structure_def))
-
-        self.handler.add_variable(PLCVariable("TestStructure", data, constants.ADST_VOID, symbol_type="TestStructure"))
+        self.handler.add_variable(
+            PLCVariable("TestStructure", STRUCTURE_BYTES, constants.ADST_VOID, symbol_type="TestStructure"))
 
         write_values = {"i": 42, "s": "bar"}
-        with self.plc:
-            symbol = self.plc.get_symbol("TestStructure", structure_def=structure_def)
-            symbol.write(write_values)
-            read_values = symbol.read()
+        symbol = self.plc.get_symbol("TestStructure", structure_def=STRUCTURE_DEF)
+        symbol.write(write_values)
+        read_values = symbol.read()
 
         self.assertEqual(write_values, read_values)
 
     def test_write_structure_array(self):
         """Test symbol value reading with structures."""
-        structure_def = (
-            ("a", pyads.PLCTYPE_INT, 1),
-            ("b", pyads.PLCTYPE_INT, 1),
-            ("s", pyads.PLCTYPE_STRING, 1)
-        )
-        values = [{"a": 1, "b": 2, "s": "foo"}, {"a": 3, "b": 4, "s": "bar"}]
-        data = bytes(bytes_from_dict(values, structure_def))
-
         self.handler.add_variable(
-            PLCVariable("TestStructure", data, constants.ADST_VOID, symbol_type="TestStructure"))
+            PLCVariable("TestStructure", STRUCTURE_ARRAY_BYTES, constants.ADST_VOID, symbol_type="TestStructure"))
 
         write_values = [{"a": 42, "b": 43, "s": "hello"}, {"a": 44, "b": 45, "s": "world"}]
-        with self.plc:
-            symbol = self.plc.get_symbol("TestStructure", structure_def=structure_def, array_size=2)
-            symbol.write(write_values)
-            read_values = symbol.read()
+        symbol = self.plc.get_symbol("TestStructure", structure_def=STRUCTURE_ARRAY_DEF, array_size=2)
+        symbol.write(write_values)
+        read_values = symbol.read()
 
         self.assertEqual(write_values, read_values)
 
     def test_value(self):
         """Test the buffer property"""
 
-        with self.plc:
-            symbol = AdsSymbol(self.plc, name=self.test_var.name)
-
-            symbol.value = 420.0  # Shouldn't change anything yet
+        symbol = AdsSymbol(self.plc, name=self.test_var.name)
 
-            self.assertAdsRequestsCount(1)  # Only a READWRITE for info
+        symbol.value = 420.0  # Shouldn't change anything yet
 
-            symbol.write()
+        self.assertAdsRequestsCount(1)  # Only a READWRITE for info
 
-            self.assertAdsRequestsCount(2)  # Written from buffer
+        symbol.write()
 
-            symbol.read()
+        self.assertAdsRequestsCount(2)  # Written from buffer
 
-            for i in range(10):
-                custom_buffer = symbol.value
+        symbol.read()
 
-            self.assertEqual(420.0, symbol.value)
+        self.assertEqual(420.0, symbol.value)  # Served from the buffer
 
-            self.assertAdsRequestsCount(3)  # Read only once
+        self.assertAdsRequestsCount(3)  # Read only once
 
     def test_get_symbol(self):
         """Test symbol by Connection method"""
-        with self.plc:
-            symbol = self.plc.get_symbol(self.test_var.name)
+        symbol = self.plc.get_symbol(self.test_var.name)
 
         # Verify looked up info
         self.assertEqual(self.test_var.name, symbol.name)
@@ -463,56 +454,77 @@ class AdsSymbolTestCase(unittest.TestCase):
         self.assertAdsRequestsCount(1)  # Only a single READWRITE must have
         # been made
 
-    def test_string(self):
-        """Test symbol with a string value"""
-        variable = PLCVariable("my_text", bytes(50), ads_type=constants.ADST_STRING,
-                               symbol_type="STRING(50)")
-        self.handler.add_variable(variable)
-
-        with self.plc:
-            symbol = self.plc.get_symbol("my_text")
-            symbol.write("I am a string!")
-            value = symbol.read()
-            self.assertEqual(value, "I am a string!")
+    def test_get_symbol_cached(self):
+        """Test repeated symbol lookup by Connection method"""
+        symbol = self.plc.get_symbol(self.test_var.name)
+        symbol2 = self.plc.get_symbol(self.test_var.name)
 
-    def test_add_notification(self):
-        """Test notification registering"""
+        self.assertEqual(symbol.index_group, symbol2.index_group)
+        self.assertEqual(symbol.index_offset, symbol2.index_offset)
+        self.assertEqual(symbol.plc_type, symbol2.plc_type)
+        self.assertEqual(self.test_var.comment, symbol2.comment)
+        self.assertAdsRequestsCount(1)  # Second lookup is served from cache
 
-        def my_callback(*_):
-            return
+        self.plc.get_symbol(self.test_var.name, cache_symbol_info=False)
+        self.assertAdsRequestsCount(2)
 
-        with self.plc:
+    def test_get_symbol_cache_cleared_on_close(self):
+        """Test symbol info is looked up again after reconnecting"""
+        self.plc.get_symbol(self.test_var.name)
+        self.plc.close()
+        self.assertEqual({}, self.plc._symbol_info_cache)
 
-            symbol = self.plc.get_symbol(self.test_var.name)
+        # The target now holds a different variable by the same name
+        self.handler.reset()
+        new_var = PLCVariable(
+            self.test_var.name, TEST_DOUBLE_BYTES, ads_type=constants.ADST_REAL64,
+            symbol_type="LREAL", index_offset=self.test_var.index_offset + 100,
+        )
+        self.handler.add_variable(new_var)
+        self.test_server.request_history.clear()
 
-            handles = symbol.add_device_notification(my_callback)
+        self.plc.open()
+        symbol = self.plc.get_symbol(self.test_var.name)
+        self.assertEqual(new_var.index_offset, symbol.index_offset)
+        self.assertAdsRequestsCount(1)
 
-            symbol.del_device_notification(handles)
+    def test_string(self):
+        """Test symbol with a string value"""
+        variable = PLCVariable("my_text", bytes(50), ads_type=constants.ADST_STRING,
+                               symbol_type="STRING(50)")
+        self.handler.add_variable(variable)
 
-        self.assertAdsRequestsCount(3)  # READWRITE, ADDNOTE and DELNOTE
+        symbol = self.plc.get_symbol("my_text")
+        symbol.write("I am a string!")
+        value = symbol.read()
+        self.assertEqual(value, "I am a string!")
 
-    def test_add_notification_delete(self):
-        """Test notification registering"""
+    def test_add_notification(self):
+        """Test notification registering and removal"""
 
         def my_callback(*_):
             return
 
-        self.plc.open()
+        for explicit_delete in (True, False):
+            with self.subTest(explicit_delete=explicit_delete):
+                self.test_server.request_history.clear()
 
-        symbol = self.plc.get_symbol(self.test_var.name)
+                symbol = self.plc.get_symbol(self.test_var.name, cache_symbol_info=False)
 
-        symbol.add_device_notification(my_callback)
-        # with `self.plc: ... ` without del_device_notification causes a
-        # socket write error
+                handles = symbol.add_device_notification(my_callback)
 
-        del symbol  # Force variable deletion
+                if explicit_delete:
+                    symbol.del_device_notification(handles)
+                else:
+                    # Deleting the symbol removes its notifications, with
+                    # `self.plc: ... ` this used to cause a socket write error
+                    del symbol  # Force variable deletion
 
-        self.assertAdsRequestsCount(3)  # READWRITE, ADDNOTE and DELNOTE
+                self.assertAdsRequestsCount(3)  # READWRITE, ADDNOTE and DELNOTE
 
     def test_notification_callback(self):
         """Test notification callback with real value change"""
 
-        self.plc.open()
         symbol = self.plc.get_symbol(self.test_var.name)
 
         # Create a mock callback
@@ -539,8 +551,6 @@ class AdsSymbolTestCase(unittest.TestCase):
 
     def test_auto_update(self):
         """Test auto-update feature"""
-        self.plc.open()
-
         symbol = self.plc.get_symbol(self.test_var.name)
         self.assertIsNone(symbol._auto_update_handle)
 
@@ -573,21 +583,18 @@ class AdsSymbolTestCase(unittest.TestCase):
 
     def test_read_device_info(self):
         """Additional - Test read_device_info for AdvancedHandler."""
-        with self.plc:
-            name, version = self.plc.read_device_info()
-            self.assertEqual(name, "TestServer")
-            self.assertEqual(version.build, 3)
+        name, version = self.plc.read_device_info()
+        self.assertEqual(name, "TestServer")
+        self.assertEqual(version.build, 3)
 
     def test_read_state(self):
         """Additional - Test read_state for AdvancedHandler."""
-        with self.plc:
-            state = self.plc.read_state()
-            self.assertEqual(state[0], constants.ADSSTATE_RUN)
+        state = self.plc.read_state()
+        self.assertEqual(state[0], constants.ADSSTATE_RUN)
 
     def test_write_control(self):
         """Additional - Test write_control for AdvancedHandler."""
-        with self.plc:
-            self.plc.write_control(constants.ADSSTATE_IDLE, 0, 0, constants.PLCTYPE_INT)
+        self.plc.write_control(constants.ADSSTATE_IDLE, 0, 0, constants.PLCTYPE_INT)
 
 
 class TypesTestCase(unittest.TestCase):
@@ -603,22 +610,24 @@ class TypesTestCase(unittest.TestCase):
 
     def test_arrays(self):
         n = 7
-        self.assertSizeOf(constants.PLCTYPE_ARR_REAL(n), 4 * n)
-        self.assertSizeOf(constants.PLCTYPE_ARR_LREAL(n), 8 * n)
-        self.assertSizeOf(constants.PLCTYPE_ARR_BOOL(n), 1 * n)
-        self.assertSizeOf(constants.PLCTYPE_ARR_INT(n), 2 * n)
-        self.assertSizeOf(constants.PLCTYPE_ARR_UINT(n), 2 * n)
-        self.assertSizeOf(constants.PLCTYPE_ARR_SHORT(n), 2 * n)
-        self.assertSizeOf(constants.PLCTYPE_ARR_USHORT(n), 2 * n)
-        self.assertSizeOf(constants.PLCTYPE_ARR_DINT(n), 4 * n)
-        self.assertSizeOf(constants.PLCTYPE_ARR_UDINT(n), 4 * n)
-        self.assertSizeOf(constants.PLCTYPE_ARR_USINT(n), 1 * n)
+        for factory, item_size in ARRAY_TYPE_SIZES:
+            with self.subTest(factory=factory.__name__):
+                self.assertSizeOf(factory(n), item_size * n)
+                # ctypes reuses array types, no new class per call
+                self.assertIs(factory(n), factory(n))
 
     def test_string(self):
         type_str = 'STRING(80)'  # This is how a string might appear
         plc_type = AdsSymbol.get_type_from_str(type_str)
         self.assertSizeOf(plc_type, 1 * 80)
 
+    def test_type_from_str_cached(self):
+        type_str = 'ARRAY [1..5] OF INT'
+        plc_type = AdsSymbol.get_type_from_str(type_str)
+        hits = AdsSymbol.get_type_from_str.cache_info().hits
+        self.assertIs(AdsSymbol.get_type_from_str(type_str), plc_type)
+        self.assertEqual(AdsSymbol.get_type_from_str.cache_info().hits, hits + 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,7 +7,7 @@ Since the test server has become a user feature in itself, these tests supplemen
 regular pyads tests to increase the coverage of the test server itself.
 """
 
-import time
+import threading
 import unittest
 import pyads
 from pyads.testserver import AdsTestServer, BasicHandler
@@ -29,9 +29,18 @@ class TestServerTestCase(unittest.TestCase):
         handler = BasicHandler()
         test_server = AdsTestServer(handler=handler, logging=False)
         test_server.start()
-        time.sleep(0.1)  # Give server a moment to spin up
+        self.assertTrue(test_server.wait_until_ready(timeout=1))
         test_server.stop()
-        time.sleep(0.1)  # Give server a moment to spin up
+
+    def test_stop_right_after_start(self):
+        # stop() must not block when the server loop has not started yet
+        test_server = AdsTestServer(handler=BasicHandler(), logging=False)
+        test_server.start()
+        stopper = threading.Thread(target=test_server.stop, daemon=True)
+        stopper.start()
+        stopper.join(timeout=5)
+        self.assertFalse(stopper.is_alive())
+        self.assertFalse(test_server.is_alive())
 
     def test_context(self):
         handler = BasicHandler()
@@ -39,15 +48,11 @@ class TestServerTestCase(unittest.TestCase):
 
         with test_server:
 
-            time.sleep(0.1)  # Give server a moment to spin up
-
             plc = pyads.Connection(TEST_SERVER_AMS_NET_ID, TEST_SERVER_AMS_PORT)
             with plc:
                 byte = plc.read(12345, 1000, pyads.PLCTYPE_BYTE)
                 self.assertEqual(byte, 0)
 
-        time.sleep(0.1)  # Give server a moment to spin down
-
     def test_server_disconnect_then_del_device_notification(self):
         """Test no error thown, when ADS symbol with device_notification is cleaned up after the server went offline.
 
@@ -57,7 +62,7 @@ class TestServerTestCase(unittest.TestCase):
         handler = BasicHandler()
         test_server = AdsTestServer(handler=handler, logging=False)
         test_server.start()
-        time.sleep(0.1)  # Give server a moment to spin up
+        test_server.wait_until_ready(timeout=1)
 
         # 2. open a plc connection to the test server:
         plc = pyads.Connection(TEST_SERVER_AMS_NET_ID, TEST_SERVER_AMS_PORT)
@@ -67,13 +72,11 @@ class TestServerTestCase(unittest.TestCase):
         test_int = pyads.AdsSymbol(plc, "TestSymbol", symbol_type=pyads.PLCTYPE_INT)
         test_int.plc_type = pyads.PLCTYPE_INT
         test_int.auto_update = True
-        time.sleep(0.1)  # Give server a moment
 
         raised_error: str = ""
 
         # 4. stop the test server
         test_server.stop()
-        time.sleep(0.1)  # Give server a moment
 
         try:
             # some code, where test_int is cleared by the Garbage collector after the server was stopped
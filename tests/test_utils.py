@@ -1,4 +1,4 @@
-from unittest import TestCase
+from unittest import TestCase, main
 
 from pyads.utils import deprecated, find_wstring_null_terminator
 
@@ -17,3 +17,12 @@ class UtilsTestCase(TestCase):
         self.assertEqual(None, find_wstring_null_terminator(data))
         data = "hello world".encode("utf-16-le") + b"\x00\x00"
         self.assertEqual(22, find_wstring_null_terminator(data))
+        # The null bytes of "a\u0100" are not aligned to a character
+        data = "a\u0100".encode("utf-16-le")
+        self.assertEqual(None, find_wstring_null_terminator(data))
+        data = "a\u0100".encode("utf-16-le") + b"\x00\x00"
+        self.assertEqual(4, find_wstring_null_terminator(data))
+
+
+if __name__ == "__main__":
+    main()